@@ -0,0 +1 @@
+"""Mediciones de rendimiento del organizador de tareas (ver benchmarks.medir)."""
@@ -0,0 +1,77 @@
+"""Generador de tareas sintéticas para las mediciones.
+
+Las tareas se parecen a las reales: categorías con distinta frecuencia, fechas
+de vencimiento alrededor de hoy, títulos y descripciones de largo variable y
+una parte completadas o importantes. Con la misma semilla se obtienen siempre
+las mismas tareas.
+
+Uso: python -m benchmarks.generador 100000 tareas.json
+"""
+
+import json
+import random
+import sys
+
+from organizador.fechas import dia_a_fecha, dia_actual
+
+PALABRAS = (
+    "revisar enviar preparar informe reunión llamar comprar pagar factura estudiar "
+    "capítulo examen proyecto presentación correo cliente proveedor médico turno "
+    "gimnasio café almuerzo cumpleaños regalo viaje pasaje hotel reserva código "
+    "error corrección diseño documento contrato banco trámite mudanza limpieza "
+    "jardín auto service seguro impuesto declaración lectura práctica ejercicio "
+    "equipo planificación sprint revisión entrega año mañana niño señal canción"
+).split()
+
+# Frecuencia relativa de cada categoría
+PESOS_CATEGORIAS = {"General": 4, "Personal": 3, "Trabajo": 5, "Estudio": 2}
+
+PROPORCION_COMPLETADAS = 0.35
+PROPORCION_IMPORTANTES = 0.1
+PROPORCION_SIN_DESCRIPCION = 0.4
+PROPORCION_SIN_FECHA = 0.05
+
+def _texto(azar, largo_maximo):
+    """Arma un texto de palabras al azar con a lo sumo largo_maximo caracteres."""
+    largo = azar.randint(min(5, largo_maximo), largo_maximo)
+    palabras = []
+    total = -1
+    while True:
+        palabra = azar.choice(PALABRAS)
+        if total + len(palabra) + 1 > largo and palabras:
+            break
+        palabras.append(palabra)
+        total += len(palabra) + 1
+    return " ".join(palabras).capitalize()[:largo_maximo].strip()
+
+def generar_tareas(cantidad, semilla=0, hoy=None):
+    """Devuelve una lista de tareas sintéticas con ids de 1 a cantidad."""
+    azar = random.Random(semilla)
+    if hoy is None:
+        hoy = dia_actual()
+    categorias = list(PESOS_CATEGORIAS)
+    pesos = list(PESOS_CATEGORIAS.values())
+    tareas = []
+    for id_tarea in range(1, cantidad + 1):
+        completada = azar.random() < PROPORCION_COMPLETADAS
+        if azar.random() < PROPORCION_SIN_FECHA:
+            fecha = ""
+        else:
+            # Las completadas suelen ser de fechas pasadas; las pendientes, de las próximas semanas
+            fecha = dia_a_fecha(hoy + (azar.randint(-120, 10) if completada else azar.randint(-30, 180)))
+        tareas.append({
+            "id": id_tarea,
+            "titulo": _texto(azar, 50),
+            "descripcion": "" if azar.random() < PROPORCION_SIN_DESCRIPCION else _texto(azar, 200),
+            "completada": completada,
+            "categoria": azar.choices(categorias, pesos)[0],
+            "fecha_vencimiento": fecha,
+            "importante": azar.random() < PROPORCION_IMPORTANTES
+        })
+    return tareas
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("Uso: python -m benchmarks.generador <cantidad> <archivo.json>")
+    with open(sys.argv[2], "w") as f:
+        json.dump(generar_tareas(int(sys.argv[1])), f)
@@ -0,0 +1,212 @@
+"""Mediciones de la carga, el guardado, el orden, las estadísticas y la lista de tareas.
+
+Uso:
+    python -m benchmarks.medir [--tamanos 1000 10000] [--repeticiones 3] [--salida resultados.json]
+    python -m benchmarks.medir --comparar anterior.json nuevo.json
+
+Las mediciones de la lista necesitan tkinter y una pantalla; en un servidor se
+pueden correr con xvfb-run. Sin alguno de los dos se omiten y el resultado
+indica el motivo.
+Los archivos de tareas se escriben en un directorio temporal, con el
+almacenamiento elegido por TAREAS_ALMACENAMIENTO.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.generador import generar_tareas
+from organizador import almacenamiento, estadisticas, modelo
+from organizador.fechas import dia_actual, es_tarea_vencida
+from organizador.registro import desde_dict
+
+TAMANOS = [1000, 10000, 100000, 1000000]
+REPETICIONES = 3
+# Diferencia relativa a partir de la cual una medición se considera más lenta
+TOLERANCIA = 0.1
+
+def _medir(funcion, repeticiones, preparar=None):
+    """Ejecuta la función varias veces y devuelve sus tiempos en segundos."""
+    tiempos = []
+    for _ in range(repeticiones):
+        if preparar is not None:
+            preparar()
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return {"min": min(tiempos), "mediana": statistics.median(tiempos), "tiempos": tiempos}
+
+def _version():
+    """Devuelve el commit actual del repositorio, marcado si tiene cambios sin guardar."""
+    directorio = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=directorio,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        cambios = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=directorio,
+                                 capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("+cambios" if cambios else "")
+
+def medir_almacenamiento(tareas, repeticiones):
+    """Mide guardar y cargar todas las tareas."""
+    def guardar():
+        almacenamiento.guardar_tareas(tareas)
+        almacenamiento.esperar_escrituras()
+
+    return {
+        "guardar_tareas": _medir(guardar, repeticiones),
+        "cargar_tareas": _medir(almacenamiento.cargar_tareas, repeticiones)
+    }
+
+def medir_modelo(tareas, repeticiones):
+    """Mide el orden de la lista, las estadísticas y el cálculo de tareas vencidas."""
+    hoy = dia_actual()
+    modelo.tareas.clear()
+    modelo.tareas.update(tareas)
+
+    def vencidas():
+        for tarea in tareas.values():
+            es_tarea_vencida(tarea, hoy)
+
+    return {
+        "ordenar_tareas": _medir(modelo.ordenar_tareas, repeticiones),
+        "recontar_estadisticas": _medir(lambda: estadisticas.recontar_estadisticas(modelo.tareas), repeticiones),
+        "calcular_estadisticas": _medir(lambda: estadisticas.calcular_estadisticas(modelo.tareas), repeticiones),
+        "es_tarea_vencida": _medir(vencidas, repeticiones)
+    }
+
+def medir_lista(interfaz, repeticiones):
+    """Mide el pintado de la lista con las tareas que ya están en el modelo."""
+    ventana = interfaz.ventana
+    interfaz.actualizar_lista_tareas()
+    ventana.update()
+    id_tarea = modelo.tareas_en_orden(0, 1)[0].id
+
+    def repintar():
+        interfaz.actualizar_lista_tareas()
+        ventana.update_idletasks()
+
+    def desplazar():
+        interfaz.canvas_lista.yview_scroll(1, "pages")
+        ventana.update_idletasks()
+
+    def alternar():
+        modelo.alternar_completada(id_tarea)
+        interfaz.refrescar_tareas(id_tarea)
+        ventana.update_idletasks()
+
+    resultados = {
+        "lista_actualizar": _medir(repintar, repeticiones),
+        "lista_desplazar": _medir(desplazar, repeticiones),
+        "lista_alternar_completada": _medir(alternar, repeticiones)
+    }
+    interfaz.canvas_lista.yview_moveto(0)
+    return resultados
+
+def medir(tamanos, repeticiones, semilla=0):
+    """Corre todas las mediciones para cada cantidad de tareas y devuelve los resultados."""
+    resultados = {
+        "version": _version(),
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "almacenamiento": almacenamiento.ALMACENAMIENTO,
+        "semilla": semilla,
+        "repeticiones": repeticiones,
+        "tamanos": {}
+    }
+    # La interfaz se importa recién acá: sin tkinter se omiten solo las mediciones de la lista
+    try:
+        import tkinter as tk
+        from organizador import interfaz
+    except ImportError as error:
+        motivo_sin_lista = str(error)
+    else:
+        try:
+            interfaz.crear_ventana()
+            interfaz.ventana.geometry("600x600")
+            motivo_sin_lista = None
+        except tk.TclError as error:
+            motivo_sin_lista = str(error)
+
+    directorio_original = os.getcwd()
+    with tempfile.TemporaryDirectory() as directorio:
+        os.chdir(directorio)
+        try:
+            for cantidad in tamanos:
+                tareas = {tarea.id: tarea for tarea in map(desde_dict, generar_tareas(cantidad, semilla))}
+                medidas = {}
+                medidas.update(medir_almacenamiento(tareas, repeticiones))
+                medidas.update(medir_modelo(tareas, repeticiones))
+                if motivo_sin_lista is None:
+                    medidas.update(medir_lista(interfaz, repeticiones))
+                else:
+                    medidas["lista"] = {"omitido": motivo_sin_lista}
+                resultados["tamanos"][str(cantidad)] = medidas
+                for nombre, medida in medidas.items():
+                    if "mediana" in medida:
+                        print(f"{cantidad:>8} tareas  {nombre:<28} {medida['mediana'] * 1000:10.2f} ms", file=sys.stderr)
+        finally:
+            almacenamiento.esperar_escrituras()
+            os.chdir(directorio_original)
+    if motivo_sin_lista is None:
+        interfaz.ventana.destroy()
+    return resultados
+
+def comparar(anterior, nuevo, tolerancia=TOLERANCIA):
+    """Muestra cuánto cambió cada medición y devuelve cuántas empeoraron más de la tolerancia."""
+    empeoradas = 0
+    print(f"{anterior.get('version')} -> {nuevo.get('version')}")
+    for cantidad, medidas in nuevo["tamanos"].items():
+        previas = anterior["tamanos"].get(cantidad, {})
+        for nombre, medida in medidas.items():
+            previa = previas.get(nombre, {})
+            if "mediana" not in medida or not previa.get("mediana"):
+                continue
+            relacion = medida["mediana"] / previa["mediana"]
+            marca = ""
+            if relacion > 1 + tolerancia:
+                marca = "  MÁS LENTO"
+                empeoradas += 1
+            elif relacion < 1 - tolerancia:
+                marca = "  más rápido"
+            print(f"{cantidad:>8} tareas  {nombre:<28} {previa['mediana'] * 1000:10.2f} -> "
+                  f"{medida['mediana'] * 1000:10.2f} ms  (x{relacion:.2f}){marca}")
+    return empeoradas
+
+def main(argumentos=None):
+    """Corre las mediciones o compara dos resultados desde la línea de comandos."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.medir", description=__doc__.splitlines()[0])
+    parser.add_argument("--tamanos", type=int, nargs="+", default=TAMANOS, help="cantidades de tareas a medir")
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--salida", help="archivo JSON para los resultados (por defecto, la salida estándar)")
+    parser.add_argument("--comparar", nargs=2, metavar=("ANTERIOR", "NUEVO"),
+                        help="compara dos archivos de resultados en lugar de medir")
+    argumentos = parser.parse_args(argumentos)
+
+    if argumentos.comparar:
+        with open(argumentos.comparar[0]) as f:
+            anterior = json.load(f)
+        with open(argumentos.comparar[1]) as f:
+            nuevo = json.load(f)
+        return 1 if comparar(anterior, nuevo) else 0
+
+    resultados = medir(argumentos.tamanos, argumentos.repeticiones, argumentos.semilla)
+    if argumentos.salida:
+        with open(argumentos.salida, "w") as f:
+            json.dump(resultados, f, indent=2)
+    else:
+        json.dump(resultados, sys.stdout, indent=2)
+        print()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
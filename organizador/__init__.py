@@ -0,0 +1,6 @@
+"""Núcleo del Organizador de Tareas.
+
+Contiene el modelo de tareas, su persistencia, la validación y las estadísticas,
+sin depender de tkinter: se puede importar y usar sin una pantalla disponible.
+La interfaz gráfica está en organizador.interfaz.
+"""
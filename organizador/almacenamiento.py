@@ -0,0 +1,927 @@
+"""Persistencia de las tareas: snapshot JSON con journal de operaciones, o SQLite.
+
+Varias instancias pueden usar los mismos archivos: las escrituras se hacen con un
+cerrojo de archivo (tareas.lock), los ids nuevos se reservan de a bloques en ese
+mismo archivo y cada instancia incorpora los cambios de las demás con
+leer_cambios_externos. Una compactación nunca pisa cambios que todavía no se leyeron.
+
+Las tareas completadas hace tiempo se pasan al archivo de tareas archivadas
+(tareas.archivadas.jsonl.gz), que no se lee al cargar sino solo al consultarlo.
+"""
+
+import contextlib
+import gzip
+import hashlib
+import io
+import itertools
+import json
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from organizador.fechas import dia_a_fecha, fecha_a_dia
+from organizador.instrumentacion import medido, medir
+from organizador.registro import a_dict
+
+# Nombre del archivo para guardar las tareas
+ARCHIVO_TAREAS = "tareas.json"
+# Journal con las operaciones realizadas desde el último snapshot
+ARCHIVO_JOURNAL = "tareas.journal"
+# Cantidad de operaciones en el journal a partir de la cual se compacta
+UMBRAL_COMPACTACION = 500
+# Segundos sin cambios que se esperan antes de escribir una ráfaga de cambios
+ESPERA_ESCRITURA = 0.3
+# Máximo de segundos que un cambio puede esperar a ser escrito
+ESPERA_MAXIMA_ESCRITURA = 2.0
+# Segundos entre reintentos de una escritura que falló
+ESPERA_REINTENTO = 5.0
+# Cantidad de tareas que se entregan juntas durante la carga
+TAM_BLOQUE_CARGA = 2000
+# Base de datos para el almacenamiento SQLite
+ARCHIVO_BASE_DATOS = "tareas.db"
+# Tipo de almacenamiento: "json" (snapshot + journal) o "sqlite"
+ALMACENAMIENTO = os.environ.get("TAREAS_ALMACENAMIENTO", "json")
+# Archivo de cerrojo compartido entre instancias; guarda también el último id reservado
+ARCHIVO_CERROJO = "tareas.lock"
+# Cantidad de ids que una instancia reserva de una vez
+TAM_RESERVA_IDS = 1000
+# Archivo comprimido con las tareas archivadas: miembros gzip con una tarea JSON por línea
+ARCHIVO_ARCHIVADAS = "tareas.archivadas.jsonl.gz"
+
+class ArchivoCorruptoError(Exception):
+    """El archivo de tareas no se pudo leer; se apartó con el nombre indicado."""
+
+    def __init__(self, respaldo):
+        super().__init__(f"El archivo de tareas está dañado y se guardó como {respaldo}")
+        self.respaldo = respaldo
+
+_DECODIFICADOR = json.JSONDecoder()
+_ESPACIOS = re.compile(r"\s*")
+
+# Estado del almacenamiento
+_cerrojo_archivos = threading.Lock()
+_huella_actual = None
+_operaciones_en_journal = 0
+_cola_escritura = queue.Queue()
+_hilo_escritor = None
+_error_escritura = None  # error de la última escritura, mientras haya cambios sin escribir
+_error_avisado = False  # si ya se informó _error_escritura con nuevo_error_escritura
+_lote_fallido = []  # pedidos que no se pudieron escribir, que se reintentan antes que los nuevos
+_carga_en_curso = False
+_ids_sin_guardar = False  # si la última carga asignó ids que todavía no están en el snapshot
+_conexion = None
+_ultimo_id = 0
+_ids_reservados = 0  # último id del bloque reservado por esta instancia
+# Lo que esta instancia ya leyó o escribió, para reconocer los cambios de otras
+_snapshot_visto = None  # (inodo, fecha de modificación, tamaño) del snapshot
+_journal_visto = (None, 0)  # (inodo, bytes) del journal ya incorporados en memoria
+_version_sqlite = None  # PRAGMA data_version de la base de datos ya incorporada
+
+def _bloquear(descriptor):
+    """Toma el cerrojo exclusivo del archivo, esperando a que otra instancia lo libere."""
+    if fcntl is not None:
+        fcntl.flock(descriptor, fcntl.LOCK_EX)
+        return
+    os.lseek(descriptor, 0, os.SEEK_SET)
+    while True:
+        try:
+            # LK_LOCK reintenta durante 10 segundos antes de fallar
+            msvcrt.locking(descriptor, msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+def _desbloquear(descriptor):
+    """Libera el cerrojo del archivo."""
+    if fcntl is not None:
+        fcntl.flock(descriptor, fcntl.LOCK_UN)
+    else:
+        os.lseek(descriptor, 0, os.SEEK_SET)
+        msvcrt.locking(descriptor, msvcrt.LK_UNLCK, 1)
+
+@contextlib.contextmanager
+def _bloqueo_archivos():
+    """Excluye a los demás hilos y a las demás instancias mientras se usan los archivos."""
+    with _cerrojo_archivos:
+        descriptor = os.open(ARCHIVO_CERROJO, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _bloquear(descriptor)
+            try:
+                yield descriptor
+            finally:
+                _desbloquear(descriptor)
+        finally:
+            os.close(descriptor)
+
+def _identidad(ruta):
+    """Devuelve (inodo, fecha de modificación, tamaño) del archivo, o None si no existe."""
+    try:
+        estado = os.stat(ruta)
+    except FileNotFoundError:
+        return None
+    return estado.st_ino, estado.st_mtime_ns, estado.st_size
+
+def _journal_actual():
+    """Devuelve (inodo, bytes) del journal, o (None, 0) si no existe."""
+    identidad = _identidad(ARCHIVO_JOURNAL)
+    return (None, 0) if identidad is None else (identidad[0], identidad[2])
+
+def _hay_cambios_sin_ver():
+    """Indica si otra instancia modificó el snapshot o el journal desde la última lectura."""
+    return _identidad(ARCHIVO_TAREAS) != _snapshot_visto or _journal_actual() != _journal_visto
+
+def _huella(contenido):
+    """Devuelve una huella corta del contenido de un snapshot."""
+    return hashlib.sha1(contenido).hexdigest()[:16]
+
+def _segmentos_rotados(huella):
+    """Devuelve los segmentos de journal rotados sobre el snapshot indicado, en orden."""
+    prefijo = f"{os.path.basename(ARCHIVO_JOURNAL)}.{huella}."
+    directorio = os.path.dirname(ARCHIVO_JOURNAL) or "."
+    segmentos = []
+    for nombre in os.listdir(directorio):
+        if nombre.startswith(prefijo) and nombre[len(prefijo):].isdigit():
+            segmentos.append((int(nombre[len(prefijo):]), os.path.join(directorio, nombre)))
+    return [ruta for _, ruta in sorted(segmentos)]
+
+def _segmentos_obsoletos(huella):
+    """Devuelve los segmentos rotados que ya están incluidos en el snapshot actual."""
+    prefijo = f"{os.path.basename(ARCHIVO_JOURNAL)}."
+    directorio = os.path.dirname(ARCHIVO_JOURNAL) or "."
+    vigentes = set(_segmentos_rotados(huella))
+    return [os.path.join(directorio, nombre) for nombre in os.listdir(directorio)
+            if nombre.startswith(prefijo) and os.path.join(directorio, nombre) not in vigentes
+            and nombre[len(prefijo):].count(".") == 1]
+
+def _reservar_ids():
+    """Reserva un bloque de ids que ninguna otra instancia va a usar."""
+    global _ultimo_id, _ids_reservados
+    with _bloqueo_archivos() as descriptor:
+        os.lseek(descriptor, 0, os.SEEK_SET)
+        try:
+            reservado = int(os.read(descriptor, 32) or 0)
+        except ValueError:
+            reservado = 0
+        _ultimo_id = max(_ultimo_id, reservado)
+        _ids_reservados = _ultimo_id + TAM_RESERVA_IDS
+        contenido = str(_ids_reservados).encode()
+        os.lseek(descriptor, 0, os.SEEK_SET)
+        os.write(descriptor, contenido)
+        os.ftruncate(descriptor, len(contenido))
+
+def _reiniciar_ids(ultimo):
+    """Toma el mayor id de las tareas cargadas; el próximo id nuevo reserva un bloque."""
+    global _ultimo_id, _ids_reservados
+    _ultimo_id = ultimo
+    _ids_reservados = 0
+
+def nuevo_id():
+    """Devuelve un id de tarea que todavía no se usó.
+
+    El último id reservado queda en tareas.lock, así que tampoco se repiten los
+    ids de las tareas archivadas o eliminadas.
+    """
+    global _ultimo_id
+    if _ultimo_id >= _ids_reservados:
+        _reservar_ids()
+    _ultimo_id += 1
+    return _ultimo_id
+
+def indexar_tareas(lista):
+    """Indexa las tareas por id, asignando uno nuevo a las que no tienen o lo repiten."""
+    _reiniciar_ids(max((t["id"] for t in lista if isinstance(t.get("id"), int)), default=0))
+    tareas = {}
+    for tarea in lista:
+        if not isinstance(tarea.get("id"), int) or tarea["id"] in tareas:
+            tarea["id"] = nuevo_id()
+        tareas[tarea["id"]] = tarea
+    return tareas
+
+def _id_de_operacion(tareas, operacion):
+    """Devuelve el id de la tarea a la que se refiere una operación del journal."""
+    if "id" in operacion:
+        return operacion["id"]
+    # Operaciones registradas antes de que las tareas tuvieran id, por posición
+    return next(itertools.islice(tareas, operacion["indice"], None))
+
+def aplicar_operacion(tareas, operacion):
+    """Aplica una operación del journal sobre las tareas indexadas por id."""
+    tipo = operacion.get("op")
+    try:
+        if tipo == "agregar":
+            tarea = operacion["tarea"]
+            if "id" not in tarea:
+                tarea["id"] = nuevo_id()
+            tareas[tarea["id"]] = tarea
+        elif tipo == "actualizar":
+            tareas[_id_de_operacion(tareas, operacion)].update(operacion["campos"])
+        elif tipo == "eliminar":
+            del tareas[_id_de_operacion(tareas, operacion)]
+        elif tipo == "vaciar":
+            tareas.clear()
+    except (KeyError, StopIteration):
+        pass
+
+def _leer_journal(ruta, inicio=0):
+    """Lee las operaciones de un archivo de journal, desde el byte indicado."""
+    operaciones = []
+    with open(ruta, "rb") as f:
+        f.seek(inicio)
+        for linea in f:
+            try:
+                operaciones.append(json.loads(linea))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # Línea incompleta por una escritura interrumpida: se descarta solo esa línea
+                continue
+    return operaciones
+
+def _plegar_journal(operaciones):
+    """Resume las operaciones del journal por tarea, para aplicarlas mientras se lee el snapshot.
+
+    Devuelve (vaciada, cambios, eliminadas, nuevas), o None si hay operaciones de
+    versiones anteriores, que se refieren a las tareas por posición.
+    """
+    vaciada = False
+    cambios = {}  # id de una tarea del snapshot -> campos modificados
+    eliminadas = set()
+    nuevas = {}  # id -> tarea agregada después del snapshot
+    for operacion in operaciones:
+        tipo = operacion.get("op")
+        if tipo == "agregar":
+            tarea = operacion["tarea"]
+            if "id" not in tarea:
+                return None
+            nuevas[tarea["id"]] = tarea
+        elif tipo in ("actualizar", "eliminar"):
+            if "id" not in operacion:
+                return None
+            id_tarea = operacion["id"]
+            if tipo == "actualizar":
+                if id_tarea in nuevas:
+                    nuevas[id_tarea].update(operacion["campos"])
+                else:
+                    cambios.setdefault(id_tarea, {}).update(operacion["campos"])
+            else:
+                nuevas.pop(id_tarea, None)
+                cambios.pop(id_tarea, None)
+                eliminadas.add(id_tarea)
+        elif tipo == "vaciar":
+            vaciada = True
+            cambios.clear()
+            eliminadas.clear()
+            nuevas.clear()
+    return vaciada, cambios, eliminadas, nuevas
+
+def _iterar_lista_json(texto):
+    """Recorre los elementos de un arreglo JSON de a uno, sin decodificarlo entero."""
+    posicion = _ESPACIOS.match(texto).end()
+    if posicion == len(texto):
+        return
+    if texto[posicion] != "[":
+        raise ValueError("Se esperaba un arreglo de tareas")
+    posicion = _ESPACIOS.match(texto, posicion + 1).end()
+    if texto.startswith("]", posicion):
+        return
+    while True:
+        elemento, posicion = _DECODIFICADOR.raw_decode(texto, posicion)
+        yield elemento
+        posicion = _ESPACIOS.match(texto, posicion).end()
+        if texto.startswith(",", posicion):
+            posicion = _ESPACIOS.match(texto, posicion + 1).end()
+        elif texto.startswith("]", posicion):
+            return
+        else:
+            raise ValueError("Arreglo de tareas incompleto")
+
+def _decodificar_snapshot(contenido):
+    """Recorre las tareas del snapshot; si está dañado lo aparta y lanza ArchivoCorruptoError."""
+    try:
+        yield from _iterar_lista_json(contenido.decode())
+    except ValueError:
+        # No se descarta en silencio: se aparta el archivo para poder recuperarlo
+        respaldo = f"{ARCHIVO_TAREAS}.corrupto-{time.strftime('%Y%m%d-%H%M%S')}"
+        os.replace(ARCHIVO_TAREAS, respaldo)
+        raise ArchivoCorruptoError(respaldo)
+
+@medido()
+def _leer_estado_json():
+    """Lee el snapshot y las operaciones del journal que hay que reaplicarle."""
+    global _huella_actual, _operaciones_en_journal, _snapshot_visto, _journal_visto
+    esperar_escrituras()
+    with _bloqueo_archivos():
+        contenido = b""
+        if os.path.exists(ARCHIVO_TAREAS):
+            with open(ARCHIVO_TAREAS, "rb") as f:
+                contenido = f.read()
+        _huella_actual = _huella(contenido)
+        _snapshot_visto = _identidad(ARCHIVO_TAREAS)
+
+        # Los segmentos rotados de una compactación que no llegó a reemplazar el
+        # snapshot se reaplican; los de una compactación terminada se descartan.
+        for ruta in _segmentos_obsoletos(_huella_actual):
+            os.remove(ruta)
+        operaciones = []
+        for ruta in _segmentos_rotados(_huella_actual):
+            operaciones.extend(_leer_journal(ruta))
+        _journal_visto = _journal_actual()
+        if os.path.exists(ARCHIVO_JOURNAL):
+            operaciones.extend(_leer_journal(ARCHIVO_JOURNAL))
+    _operaciones_en_journal = len(operaciones)
+    return contenido, operaciones
+
+def _cargar_tareas_json_por_bloques(tam_bloque):
+    """Carga las tareas del snapshot JSON de a bloques, con el journal ya aplicado."""
+    global _ultimo_id, _carga_en_curso, _ids_sin_guardar
+    contenido, operaciones = _leer_estado_json()
+    plegado = _plegar_journal(operaciones)
+    if plegado is None:
+        # Journal de una versión anterior: se reaplica sobre el snapshot completo
+        tareas = indexar_tareas(list(_decodificar_snapshot(contenido)))
+        for operacion in operaciones:
+            aplicar_operacion(tareas, operacion)
+        _guardar_tareas_json(tareas)
+        yield list(tareas.values())
+        return
+
+    vaciada, cambios, eliminadas, nuevas = plegado
+    _reiniciar_ids(max(nuevas, default=0))
+    _carga_en_curso = True
+    try:
+        sin_id = []
+        vistos = set()
+        bloque = []
+        for tarea in () if vaciada else _decodificar_snapshot(contenido):
+            id_tarea = tarea.get("id")
+            if not isinstance(id_tarea, int) or id_tarea in vistos:
+                sin_id.append(tarea)
+                continue
+            vistos.add(id_tarea)
+            _ultimo_id = max(_ultimo_id, id_tarea)
+            # Una tarea que el journal volvió a agregar (restaurada del archivo) vale
+            # en la versión del journal, con el mismo id
+            if id_tarea in eliminadas or id_tarea in nuevas:
+                continue
+            if id_tarea in cambios:
+                tarea.update(cambios[id_tarea])
+            bloque.append(tarea)
+            if len(bloque) >= tam_bloque:
+                yield bloque
+                bloque = []
+        bloque.extend(nuevas.values())
+        for tarea in sin_id:
+            tarea["id"] = nuevo_id()
+            bloque.append(tarea)
+        yield bloque
+    finally:
+        _carga_en_curso = False
+    # Los ids asignados a tareas de versiones anteriores se guardan con
+    # guardar_ids_asignados, desde las tareas en memoria: estos dicts no tienen
+    # los cambios que se hicieron mientras se cargaba
+    _ids_sin_guardar = bool(sin_id)
+
+def guardar_ids_asignados(tareas):
+    """Guarda un snapshot si la última carga asignó ids a tareas que no tenían.
+
+    Se llama al terminar la carga con las tareas en memoria, que ya incluyen los
+    cambios hechos durante la carga.
+    """
+    global _ids_sin_guardar
+    if _ids_sin_guardar:
+        _ids_sin_guardar = False
+        _guardar_tareas_json(tareas)
+
+def _escribir_snapshot(tareas):
+    """Escribe el snapshot en un archivo temporal y lo reemplaza de forma atómica."""
+    with medir("serializar_snapshot"):
+        contenido = json.dumps(list(tareas.values()), default=a_dict).encode()
+    temporal = ARCHIVO_TAREAS + ".tmp"
+    with medir("escribir_snapshot"):
+        with open(temporal, "wb") as f:
+            f.write(contenido)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, ARCHIVO_TAREAS)
+    return _huella(contenido)
+
+def _rotar_journal():
+    """Renombra el journal activo como segmento del snapshot vigente."""
+    if not os.path.exists(ARCHIVO_JOURNAL):
+        return
+    numero = len(_segmentos_rotados(_huella_actual))
+    os.replace(ARCHIVO_JOURNAL, f"{ARCHIVO_JOURNAL}.{_huella_actual}.{numero}")
+
+def _compactar(copia, forzada):
+    """Rota el journal, escribe el snapshot nuevo y elimina los segmentos que ya contiene.
+
+    Si otra instancia escribió cambios que esta todavía no leyó, no se compacta
+    (salvo que sea un guardado completo) y se devuelve False: el snapshot nuevo
+    los perdería.
+    """
+    global _huella_actual, _snapshot_visto, _journal_visto
+    with _bloqueo_archivos():
+        if not forzada and _hay_cambios_sin_ver():
+            return False
+        _rotar_journal()
+        huella = _escribir_snapshot(copia)
+        _huella_actual = huella
+        _snapshot_visto = _identidad(ARCHIVO_TAREAS)
+        _journal_visto = (None, 0)
+        for ruta in _segmentos_obsoletos(huella):
+            os.remove(ruta)
+    return True
+
+@medido()
+def _agregar_al_journal(lineas):
+    """Agrega al journal, en una sola escritura, las líneas acumuladas."""
+    global _journal_visto
+    if not lineas:
+        return
+    with _bloqueo_archivos():
+        leido_completo = _journal_actual() == _journal_visto
+        with open(ARCHIVO_JOURNAL, "a+b") as f:
+            # Una línea incompleta de una escritura interrumpida se cierra, para no
+            # pegarle la primera de estas
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write("".join(lineas).encode())
+            f.flush()
+            os.fsync(f.fileno())
+        # Si antes había cambios de otra instancia sin leer, se leen junto con estos
+        if leido_completo:
+            _journal_visto = _journal_actual()
+    lineas.clear()
+
+def _escribir_lote(lote):
+    """Escribe un lote de pedidos de la cola respetando su orden."""
+    lineas = []
+    for tipo, dato in lote:
+        if tipo == "journal":
+            lineas.append(dato)
+        elif tipo == "snapshot":
+            # Las operaciones anteriores al snapshot van al journal que se rota con él
+            _agregar_al_journal(lineas)
+            _compactar(dato, forzada=True)
+        elif tipo == "compactar":
+            copia, ids_nuevas = dato
+            _agregar_al_journal(lineas)
+            if not _compactar(copia, forzada=False):
+                # Las tareas nuevas que solo estaban en el snapshot van al journal
+                lineas = [json.dumps({"op": "agregar", "tarea": copia[id_tarea]}, default=a_dict) + "\n"
+                          for id_tarea in ids_nuevas]
+    _agregar_al_journal(lineas)
+
+def _escritor():
+    """Hilo que escribe en disco los pedidos de la cola, agrupando las ráfagas.
+
+    Si una escritura falla, sus pedidos no se descartan: se vuelven a escribir,
+    antes que los siguientes, con el próximo lote o pasados ESPERA_REINTENTO
+    segundos. Las operaciones del journal se pueden repetir sin cambiar el resultado.
+    """
+    global _error_escritura, _error_avisado, _lote_fallido
+    while True:
+        try:
+            lote = [_cola_escritura.get(timeout=ESPERA_REINTENTO if _lote_fallido else None)]
+        except queue.Empty:
+            lote = []
+        limite = time.monotonic() + ESPERA_MAXIMA_ESCRITURA
+        # Esperar a que la ráfaga de cambios termine, sin demorar más del límite
+        while lote and lote[-1][0] != "vaciar":
+            restante = min(ESPERA_ESCRITURA, limite - time.monotonic())
+            if restante <= 0:
+                break
+            try:
+                lote.append(_cola_escritura.get(timeout=restante))
+            except queue.Empty:
+                break
+        try:
+            _escribir_lote(_lote_fallido + lote)
+            _lote_fallido = []
+            _error_escritura = None
+            _error_avisado = False
+        except OSError as error:
+            _lote_fallido = _lote_fallido + lote
+            _error_escritura = error
+        finally:
+            for _ in lote:
+                _cola_escritura.task_done()
+
+def _encolar(tipo, dato=None):
+    """Agrega un pedido a la cola de escritura, iniciando el hilo escritor si hace falta."""
+    global _hilo_escritor
+    if _hilo_escritor is None or not _hilo_escritor.is_alive():
+        _hilo_escritor = threading.Thread(target=_escritor, daemon=True)
+        _hilo_escritor.start()
+    _cola_escritura.put((tipo, dato))
+
+def esperar_escrituras():
+    """Escribe enseguida los cambios pendientes y espera a que lleguen al disco.
+
+    Si quedan cambios sin escribir lanza el OSError de la última escritura; los
+    cambios se siguen reintentando.
+    """
+    if _hilo_escritor is not None:
+        _encolar("vaciar")
+        _cola_escritura.join()
+    error = _error_escritura
+    if _lote_fallido and error is not None:
+        raise error
+
+def nuevo_error_escritura():
+    """Devuelve el error de escritura todavía no informado, o None si no hay ninguno.
+
+    Cada falla se informa una sola vez, aunque sus reintentos sigan fallando.
+    """
+    global _error_avisado
+    if _error_escritura is None or _error_avisado:
+        return None
+    _error_avisado = True
+    return _error_escritura
+
+def _guardar_tareas_json(tareas):
+    """Guarda todas las tareas en un snapshot atómico y reinicia el journal."""
+    global _operaciones_en_journal
+    _operaciones_en_journal = 0
+    # La copia se toma ahora: las operaciones siguientes van al journal nuevo
+    _encolar("snapshot", {id_tarea: tarea.copy() for id_tarea, tarea in tareas.items()})
+
+def _compactar_tareas_json(tareas, nuevas=()):
+    """Encola una compactación, que se omite si hay cambios de otra instancia sin leer.
+
+    Las tareas `nuevas` todavía no están en el journal: si se omite la
+    compactación, se agregan al journal.
+    """
+    global _operaciones_en_journal
+    _operaciones_en_journal = 0
+    copia = {id_tarea: tarea.copy() for id_tarea, tarea in tareas.items()}
+    _encolar("compactar", (copia, [tarea["id"] for tarea in nuevas]))
+
+def _registrar_operacion_json(tareas, operacion):
+    """Encola una operación para el journal y compacta si creció demasiado."""
+    global _operaciones_en_journal
+    _encolar("journal", json.dumps(operacion, default=a_dict) + "\n")
+    _operaciones_en_journal += 1
+    # Mientras se carga no se compacta: las tareas en memoria todavía están incompletas
+    if _operaciones_en_journal >= UMBRAL_COMPACTACION and not _carga_en_curso:
+        _compactar_tareas_json(tareas)
+
+def _registrar_operaciones_json(tareas, operaciones):
+    """Encola varias operaciones en una sola escritura del journal y compacta si creció demasiado."""
+    global _operaciones_en_journal
+    _encolar("journal", "".join(json.dumps(operacion, default=a_dict) + "\n" for operacion in operaciones))
+    _operaciones_en_journal += len(operaciones)
+    if _operaciones_en_journal >= UMBRAL_COMPACTACION and not _carga_en_curso:
+        _compactar_tareas_json(tareas)
+
+def _registrar_lote_json(tareas, nuevas):
+    """Encola las tareas nuevas en una sola escritura del journal, o compacta si son muchas."""
+    global _operaciones_en_journal
+    if _operaciones_en_journal + len(nuevas) >= UMBRAL_COMPACTACION and not _carga_en_curso:
+        _compactar_tareas_json(tareas, nuevas)
+        return
+    _encolar("journal", "".join(json.dumps({"op": "agregar", "tarea": tarea}, default=a_dict) + "\n" for tarea in nuevas))
+    _operaciones_en_journal += len(nuevas)
+
+def _conectar_sqlite():
+    """Abre la base de datos y crea la tabla e índices si no existen."""
+    global _conexion
+    if _conexion is None:
+        _conexion = sqlite3.connect(ARCHIVO_BASE_DATOS)
+        _conexion.execute("PRAGMA journal_mode=WAL")
+        _conexion.execute("PRAGMA synchronous=NORMAL")
+        columnas = [columna[1] for columna in _conexion.execute("PRAGMA table_info(tareas)")]
+        if columnas and "completada_en" not in columnas:
+            # Tabla creada antes de que se archivaran las tareas completadas
+            _conexion.execute("ALTER TABLE tareas ADD COLUMN completada_en TEXT")
+        if columnas and "id" not in columnas:
+            # Tabla creada antes de que las tareas tuvieran id: el rowid pasa a ser el id
+            _conexion.executescript(f"""
+                BEGIN;
+                ALTER TABLE tareas RENAME TO tareas_sin_id;
+                {_TABLA_TAREAS}
+                INSERT INTO tareas (id, {_COLUMNAS}) SELECT rowid, {_COLUMNAS} FROM tareas_sin_id;
+                DROP TABLE tareas_sin_id;
+                COMMIT;
+            """)
+        _conexion.executescript(f"""
+            BEGIN;
+            {_TABLA_TAREAS}
+            CREATE INDEX IF NOT EXISTS idx_tareas_categoria ON tareas (categoria);
+            CREATE INDEX IF NOT EXISTS idx_tareas_vencimiento ON tareas (dia_vencimiento);
+            CREATE INDEX IF NOT EXISTS idx_tareas_completada ON tareas (completada, dia_vencimiento);
+            COMMIT;
+        """)
+    return _conexion
+
+_COLUMNAS = "titulo, descripcion, completada, categoria, dia_vencimiento, fecha_original, importante, completada_en"
+_TABLA_TAREAS = """
+    CREATE TABLE IF NOT EXISTS tareas (
+        id INTEGER PRIMARY KEY,
+        titulo TEXT NOT NULL,
+        descripcion TEXT NOT NULL DEFAULT '',
+        completada INTEGER NOT NULL DEFAULT 0,
+        categoria TEXT NOT NULL DEFAULT 'General',
+        dia_vencimiento INTEGER,
+        fecha_original TEXT,
+        importante INTEGER NOT NULL DEFAULT 0,
+        completada_en TEXT
+    );
+"""
+
+def _tarea_a_fila(tarea):
+    """Convierte una tarea en los valores de sus columnas."""
+    fecha = tarea.get('fecha_vencimiento')
+    dia = fecha_a_dia(fecha)
+    # Las fechas que no se pueden representar como día se guardan tal cual
+    original = fecha if fecha is not None and (dia is None or dia_a_fecha(dia) != fecha) else None
+    return (tarea['id'], tarea['titulo'], tarea.get('descripcion', ''), int(tarea['completada']),
+            tarea.get('categoria', 'General'), dia, original, int(tarea.get('importante', False)),
+            tarea.get('completada_en'))
+
+def _fila_a_tarea(fila):
+    """Convierte una fila de la tabla en una tarea."""
+    id_tarea, titulo, descripcion, completada, categoria, dia, original, importante, completada_en = fila
+    tarea = {
+        "id": id_tarea,
+        "titulo": titulo,
+        "descripcion": descripcion,
+        "completada": bool(completada),
+        "categoria": categoria,
+        "importante": bool(importante)
+    }
+    if original is not None:
+        tarea["fecha_vencimiento"] = original
+    elif dia is not None:
+        tarea["fecha_vencimiento"] = dia_a_fecha(dia)
+    if completada_en is not None:
+        tarea["completada_en"] = completada_en
+    return tarea
+
+def _cargar_tareas_sqlite_por_bloques(tam_bloque):
+    """Carga las tareas desde la base de datos de a bloques, migrando tareas.json la primera vez."""
+    global _version_sqlite
+    nueva = not os.path.exists(ARCHIVO_BASE_DATOS)
+    conexion = _conectar_sqlite()
+    if nueva and os.path.exists(ARCHIVO_TAREAS):
+        migrar_json_a_sqlite()
+    _reiniciar_ids(conexion.execute("SELECT COALESCE(MAX(id), 0) FROM tareas").fetchone()[0])
+    _version_sqlite = conexion.execute("PRAGMA data_version").fetchone()[0]
+    cursor = conexion.execute(f"SELECT id, {_COLUMNAS} FROM tareas ORDER BY id")
+    while True:
+        filas = cursor.fetchmany(tam_bloque)
+        if not filas:
+            return
+        yield [_fila_a_tarea(fila) for fila in filas]
+
+@medido()
+def _guardar_tareas_sqlite(tareas):
+    """Reemplaza todas las tareas de la base de datos en una sola transacción."""
+    conexion = _conectar_sqlite()
+    with conexion:
+        conexion.execute("DELETE FROM tareas")
+        conexion.executemany(f"INSERT INTO tareas (id, {_COLUMNAS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                             (_tarea_a_fila(tarea) for tarea in tareas.values()))
+
+def _aplicar_operacion_sqlite(conexion, tareas, operacion):
+    """Aplica una operación sobre la base de datos, dentro de la transacción en curso."""
+    tipo = operacion["op"]
+    if tipo == "agregar":
+        conexion.execute(f"INSERT INTO tareas (id, {_COLUMNAS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                         _tarea_a_fila(operacion["tarea"]))
+    elif tipo == "actualizar":
+        fila = _tarea_a_fila(tareas[operacion["id"]])
+        conexion.execute(f"UPDATE tareas SET ({_COLUMNAS}) = (?, ?, ?, ?, ?, ?, ?, ?) WHERE id = ?",
+                         fila[1:] + fila[:1])
+    elif tipo == "eliminar":
+        conexion.execute("DELETE FROM tareas WHERE id = ?", (operacion["id"],))
+    elif tipo == "vaciar":
+        conexion.execute("DELETE FROM tareas")
+
+def _registrar_operacion_sqlite(tareas, operacion):
+    """Aplica una operación directamente sobre la base de datos."""
+    conexion = _conectar_sqlite()
+    with conexion:
+        _aplicar_operacion_sqlite(conexion, tareas, operacion)
+
+def _registrar_operaciones_sqlite(tareas, operaciones):
+    """Aplica varias operaciones sobre la base de datos en una sola transacción."""
+    conexion = _conectar_sqlite()
+    with conexion:
+        for operacion in operaciones:
+            _aplicar_operacion_sqlite(conexion, tareas, operacion)
+
+def _registrar_lote_sqlite(nuevas):
+    """Inserta las tareas nuevas en una sola transacción."""
+    conexion = _conectar_sqlite()
+    with conexion:
+        conexion.executemany(f"INSERT INTO tareas (id, {_COLUMNAS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                             (_tarea_a_fila(tarea) for tarea in nuevas))
+
+def migrar_json_a_sqlite():
+    """Copia las tareas de tareas.json (con su journal) a la base de datos."""
+    global _ids_sin_guardar
+    tareas = {}
+    for bloque in _cargar_tareas_json_por_bloques(TAM_BLOQUE_CARGA):
+        tareas.update((tarea["id"], tarea) for tarea in bloque)
+    # Los ids asignados quedan guardados en la base de datos
+    _ids_sin_guardar = False
+    esperar_escrituras()
+    _guardar_tareas_sqlite(tareas)
+
+def calcular_estadisticas_sqlite(hoy):
+    """Calcula las estadísticas con consultas sobre los índices de la tabla."""
+    conexion = _conectar_sqlite()
+    total = conexion.execute("SELECT COUNT(*) FROM tareas").fetchone()[0]
+    completadas = conexion.execute("SELECT COUNT(*) FROM tareas WHERE completada = 1").fetchone()[0]
+    vencidas = conexion.execute("SELECT COUNT(*) FROM tareas WHERE completada = 0 AND dia_vencimiento <= ?",
+                                (hoy,)).fetchone()[0]
+    por_categoria = dict(conexion.execute("SELECT categoria, COUNT(*) FROM tareas GROUP BY categoria"))
+    return {
+        'total': total,
+        'completadas': completadas,
+        'pendientes': total - completadas,
+        'porcentaje': (completadas / total * 100) if total > 0 else 0,
+        'vencidas': vencidas,
+        'por_categoria': por_categoria
+    }
+
+def _agregar_al_archivo(registros):
+    """Agrega los registros al archivo de tareas archivadas, como un miembro gzip nuevo."""
+    contenido = gzip.compress("".join(json.dumps(registro, default=a_dict) + "\n" for registro in registros).encode())
+    with _bloqueo_archivos():
+        with open(ARCHIVO_ARCHIVADAS, "ab") as f:
+            f.write(contenido)
+            f.flush()
+            os.fsync(f.fileno())
+
+@medido()
+def archivar_tareas(lista):
+    """Guarda las tareas en el archivo de tareas archivadas.
+
+    Se escriben antes de quitarlas de la lista: si algo falla en el medio, la
+    tarea queda en los dos lugares y no se pierde.
+    """
+    _agregar_al_archivo(lista)
+
+def marcar_restaurada(id_tarea):
+    """Registra en el archivo que la tarea volvió a la lista."""
+    _agregar_al_archivo([{"id": id_tarea, "restaurada": True}])
+
+@medido()
+def leer_archivadas():
+    """Lee las tareas archivadas, indexadas por id, sin las que se restauraron.
+
+    Si una tarea se archivó más de una vez vale la última; un miembro incompleto
+    por una escritura interrumpida se descarta.
+    """
+    if not os.path.exists(ARCHIVO_ARCHIVADAS):
+        return {}
+    with _bloqueo_archivos():
+        with open(ARCHIVO_ARCHIVADAS, "rb") as f:
+            contenido = f.read()
+    archivadas = {}
+    try:
+        with gzip.GzipFile(fileobj=io.BytesIO(contenido)) as f:
+            for linea in f:
+                registro = json.loads(linea)
+                if registro.get("restaurada"):
+                    archivadas.pop(registro["id"], None)
+                else:
+                    archivadas[registro["id"]] = registro
+    except (EOFError, OSError, zlib.error, json.JSONDecodeError, UnicodeDecodeError):
+        pass
+    return archivadas
+
+def _diferencias(tareas, leidas):
+    """Compara las tareas en memoria con las leídas y devuelve {id: tarea leída o None si ya no está}."""
+    cambios = {id_tarea: None for id_tarea in tareas if id_tarea not in leidas}
+    for id_tarea, tarea in leidas.items():
+        if id_tarea not in tareas or a_dict(tareas[id_tarea]) != tarea:
+            cambios[id_tarea] = tarea
+    return cambios
+
+def _leer_tareas_json():
+    """Lee todas las tareas del snapshot y el journal, indexadas por id."""
+    contenido, operaciones = _leer_estado_json()
+    tareas = {tarea["id"]: tarea for tarea in _decodificar_snapshot(contenido) if isinstance(tarea.get("id"), int)}
+    for operacion in operaciones:
+        aplicar_operacion(tareas, operacion)
+    return tareas
+
+def _cambios_del_journal(tareas, operaciones):
+    """Devuelve {id: tarea o None} con el resultado de aplicar las operaciones a las tareas en memoria."""
+    vaciada, cambios, eliminadas, nuevas = _plegar_journal(operaciones)
+    resultado = dict.fromkeys(tareas if vaciada else eliminadas)
+    for id_tarea, campos in cambios.items():
+        if id_tarea in tareas and id_tarea not in resultado:
+            tarea = dict(a_dict(tareas[id_tarea]))
+            tarea.update(campos)
+            resultado[id_tarea] = tarea
+    resultado.update(nuevas)
+    return resultado
+
+def hay_cambios_externos():
+    """Indica, sin leer las tareas, si otra instancia modificó el almacenamiento."""
+    if ALMACENAMIENTO == "sqlite":
+        return _conectar_sqlite().execute("PRAGMA data_version").fetchone()[0] != _version_sqlite
+    with _cerrojo_archivos:
+        return _hay_cambios_sin_ver()
+
+@medido()
+def leer_cambios_externos(tareas):
+    """Lee los cambios que otras instancias hicieron en el almacenamiento.
+
+    Devuelve {id: tarea en el formato JSON, o None si se eliminó} solo con las
+    tareas que cambiaron respecto de las que están en memoria. Si solo creció el
+    journal se leen únicamente sus líneas nuevas; si otra instancia compactó, se
+    lee todo y se compara. Si el snapshot está dañado, se guardan las tareas en
+    memoria como snapshot nuevo y se lanza ArchivoCorruptoError.
+    """
+    global _version_sqlite, _journal_visto, _operaciones_en_journal
+    esperar_escrituras()
+    if ALMACENAMIENTO == "sqlite":
+        conexion = _conectar_sqlite()
+        _version_sqlite = conexion.execute("PRAGMA data_version").fetchone()[0]
+        leidas = {fila[0]: _fila_a_tarea(fila) for fila in conexion.execute(f"SELECT id, {_COLUMNAS} FROM tareas")}
+        return _diferencias(tareas, leidas)
+
+    with _bloqueo_archivos():
+        inodo, leidos = _journal_visto
+        actual = _journal_actual()
+        operaciones = None
+        if _identidad(ARCHIVO_TAREAS) == _snapshot_visto and inodo in (None, actual[0]) and actual[1] >= leidos:
+            operaciones = _leer_journal(ARCHIVO_JOURNAL, leidos) if actual[0] is not None else []
+            _journal_visto = actual
+    if operaciones is None or _plegar_journal(operaciones) is None:
+        try:
+            leidas = _leer_tareas_json()
+        except ArchivoCorruptoError:
+            # El snapshot dañado ya se apartó: las tareas en memoria pasan a ser el
+            # snapshot nuevo, en lugar de compararlas con un archivo que ya no está
+            _guardar_tareas_json(tareas)
+            esperar_escrituras()
+            raise
+        return _diferencias(tareas, leidas)
+    _operaciones_en_journal += len(operaciones)
+    return _cambios_del_journal(tareas, operaciones)
+
+def cargar_tareas_por_bloques(tam_bloque=None):
+    """Carga las tareas desde el almacenamiento configurado, devolviendo listas de a bloques."""
+    tam_bloque = tam_bloque or TAM_BLOQUE_CARGA
+    if ALMACENAMIENTO == "sqlite":
+        return _cargar_tareas_sqlite_por_bloques(tam_bloque)
+    return _cargar_tareas_json_por_bloques(tam_bloque)
+
+@medido()
+def cargar_tareas():
+    """Carga las tareas desde el almacenamiento configurado, indexadas por id."""
+    tareas = {}
+    for bloque in cargar_tareas_por_bloques():
+        tareas.update((tarea["id"], tarea) for tarea in bloque)
+    guardar_ids_asignados(tareas)
+    return tareas
+
+@medido()
+def guardar_tareas(tareas):
+    """Guarda todas las tareas en el almacenamiento configurado."""
+    if ALMACENAMIENTO == "sqlite":
+        _guardar_tareas_sqlite(tareas)
+    else:
+        _guardar_tareas_json(tareas)
+
+@medido()
+def registrar_operacion(tareas, operacion):
+    """Registra una modificación de la lista de tareas en el almacenamiento configurado."""
+    if ALMACENAMIENTO == "sqlite":
+        _registrar_operacion_sqlite(tareas, operacion)
+    else:
+        _registrar_operacion_json(tareas, operacion)
+
+@medido()
+def registrar_operaciones(tareas, operaciones):
+    """Registra de una sola vez varias modificaciones, en el almacenamiento configurado."""
+    if not operaciones:
+        return
+    if ALMACENAMIENTO == "sqlite":
+        _registrar_operaciones_sqlite(tareas, operaciones)
+    else:
+        _registrar_operaciones_json(tareas, operaciones)
+
+@medido()
+def registrar_tareas_nuevas(tareas, nuevas):
+    """Registra de una sola vez muchas tareas agregadas, en el almacenamiento configurado."""
+    if ALMACENAMIENTO == "sqlite":
+        _registrar_lote_sqlite(nuevas)
+    else:
+        _registrar_lote_json(tareas, nuevas)
@@ -0,0 +1,103 @@
+"""Índice de búsqueda de texto sobre el título y la descripción de las tareas."""
+
+import bisect
+import re
+import unicodedata
+
+from organizador.orden import agregar_ordenados
+
+_PALABRA = re.compile(r"\w+")
+
+# Índice invertido
+indice = {}  # término -> ids de las tareas que lo contienen
+terminos = []  # términos del índice, ordenados para buscar por prefijo
+terminos_por_tarea = {}  # id de la tarea -> sus términos
+
+def normalizar(texto):
+    """Pasa el texto a minúsculas y le quita los acentos."""
+    texto = texto.casefold()
+    if texto.isascii():
+        return texto
+    return "".join(c for c in unicodedata.normalize("NFKD", texto) if not unicodedata.combining(c))
+
+def tokenizar(texto):
+    """Devuelve las palabras normalizadas del texto."""
+    return _PALABRA.findall(normalizar(texto))
+
+def desindexar_tarea(id_tarea):
+    """Quita del índice los términos de una tarea."""
+    for termino in terminos_por_tarea.pop(id_tarea, ()):
+        ids = indice[termino]
+        ids.discard(id_tarea)
+        if not ids:
+            del indice[termino]
+            del terminos[bisect.bisect_left(terminos, termino)]
+
+def indexar_tareas(lista_tareas):
+    """Agrega o actualiza en el índice los términos de las tareas indicadas."""
+    nuevos = []
+    for tarea in lista_tareas:
+        desindexar_tarea(tarea.id)
+        propios = frozenset(tokenizar(f"{tarea.titulo} {tarea.descripcion}"))
+        terminos_por_tarea[tarea.id] = propios
+        for termino in propios:
+            ids = indice.get(termino)
+            if ids is None:
+                ids = indice[termino] = set()
+                nuevos.append(termino)
+            ids.add(tarea.id)
+    if nuevos:
+        agregar_ordenados(terminos, nuevos)
+
+def vaciar_indice():
+    """Elimina todos los términos del índice."""
+    indice.clear()
+    del terminos[:]
+    terminos_por_tarea.clear()
+
+def _rango_prefijo(prefijo):
+    """Devuelve las posiciones [inicio, fin) de los términos que empiezan con el prefijo."""
+    inicio = bisect.bisect_left(terminos, prefijo)
+    return inicio, bisect.bisect_left(terminos, prefijo + "\U0010ffff", inicio)
+
+def _contiene_prefijo(id_tarea, prefijo):
+    """Indica si alguno de los términos de la tarea empieza con el prefijo."""
+    return any(termino.startswith(prefijo) for termino in terminos_por_tarea.get(id_tarea, ()))
+
+def refina(texto, anterior):
+    """Indica si buscar el texto solo puede achicar el resultado de buscar el anterior.
+
+    Es así cuando cada palabra anterior es el comienzo de alguna palabra nueva,
+    como pasa al seguir escribiendo en el campo de búsqueda.
+    """
+    palabras = tokenizar(texto)
+    anteriores = tokenizar(anterior)
+    return bool(anteriores) and all(any(palabra.startswith(previa) for palabra in palabras) for previa in anteriores)
+
+def buscar(texto, candidatas=None):
+    """Devuelve los ids de las tareas que contienen todas las palabras buscadas.
+
+    Cada palabra puede ser el comienzo de un término. Si se indican candidatas,
+    solo se buscan entre ellas. Devuelve None si el texto no tiene palabras, es
+    decir, si no hay nada que filtrar.
+    """
+    palabras = sorted(set(tokenizar(texto)), key=len, reverse=True)
+    if not palabras:
+        return None
+    resultado = candidatas
+    # Las palabras más largas suelen ser las más selectivas, así que van primero
+    for palabra in palabras:
+        inicio, fin = _rango_prefijo(palabra)
+        if resultado is not None and len(resultado) < fin - inicio:
+            # Quedan pocas candidatas: conviene revisarlas una por una
+            resultado = {id_tarea for id_tarea in resultado if _contiene_prefijo(id_tarea, palabra)}
+        else:
+            encontradas = set().union(*[indice[termino] for termino in terminos[inicio:fin]])
+            resultado = encontradas if resultado is None else resultado & encontradas
+        if not resultado:
+            break
+    return resultado
+
+def coincide(id_tarea, texto):
+    """Indica si la tarea contiene todas las palabras buscadas."""
+    return all(_contiene_prefijo(id_tarea, palabra) for palabra in tokenizar(texto))
@@ -0,0 +1,91 @@
+"""Estadísticas de las tareas, mantenidas con contadores que se actualizan en cada cambio."""
+
+from organizador import almacenamiento
+from organizador.fechas import dia_actual, es_tarea_vencida
+from organizador.instrumentacion import medido
+
+# Contadores de las estadísticas, actualizados en cada cambio
+contadores = {'total': 0, 'completadas': 0, 'vencidas': 0, 'por_categoria': {}}
+dia_estadisticas = None  # día con el que se contaron las tareas vencidas
+
+def contar_tarea(tarea, signo):
+    """Suma (signo=1) o resta (signo=-1) el aporte de una tarea a los contadores."""
+    contadores['total'] += signo
+    if tarea.completada:
+        contadores['completadas'] += signo
+    if es_tarea_vencida(tarea, dia_estadisticas):
+        contadores['vencidas'] += signo
+    categoria = tarea.categoria
+    por_categoria = contadores['por_categoria']
+    por_categoria[categoria] = por_categoria.get(categoria, 0) + signo
+    if not por_categoria[categoria]:
+        del por_categoria[categoria]
+
+def reiniciar_estadisticas():
+    """Pone los contadores en cero, para contar las tareas a medida que se cargan."""
+    global dia_estadisticas
+    dia_estadisticas = dia_actual()
+    contadores['total'] = 0
+    contadores['completadas'] = 0
+    contadores['vencidas'] = 0
+    contadores['por_categoria'] = {}
+
+def recontar_tareas(tareas, hoy):
+    """Cuenta desde cero el total, completadas, vencidas y tareas por categoría."""
+    recuento = {'total': 0, 'completadas': 0, 'vencidas': 0, 'por_categoria': {}}
+    for tarea in tareas.values():
+        recuento['total'] += 1
+        if tarea.completada:
+            recuento['completadas'] += 1
+        if es_tarea_vencida(tarea, hoy):
+            recuento['vencidas'] += 1
+        categoria = tarea.categoria
+        recuento['por_categoria'][categoria] = recuento['por_categoria'].get(categoria, 0) + 1
+    return recuento
+
+@medido()
+def recontar_estadisticas(tareas):
+    """Reinicia los contadores con un recuento completo de las tareas."""
+    global dia_estadisticas
+    dia_estadisticas = dia_actual()
+    if almacenamiento.ALMACENAMIENTO == "sqlite":
+        recuento = almacenamiento.calcular_estadisticas_sqlite(dia_estadisticas)
+    else:
+        recuento = recontar_tareas(tareas, dia_estadisticas)
+    contadores['total'] = recuento['total']
+    contadores['completadas'] = recuento['completadas']
+    contadores['vencidas'] = recuento['vencidas']
+    contadores['por_categoria'] = dict(recuento['por_categoria'])
+
+def avanzar_dia(vencidas_nuevas, anterior, hoy, tareas):
+    """Suma las tareas que vencieron al pasar del día `anterior` a `hoy`."""
+    global dia_estadisticas
+    if dia_estadisticas == anterior:
+        contadores['vencidas'] += vencidas_nuevas
+        dia_estadisticas = hoy
+    elif dia_estadisticas != hoy:
+        # Los contadores se contaron con otro día: se cuentan de nuevo
+        recontar_estadisticas(tareas)
+
+def verificar_estadisticas(tareas):
+    """Comprueba que los contadores coinciden con un recuento completo de las tareas."""
+    return contadores == recontar_tareas(tareas, dia_estadisticas)
+
+def calcular_estadisticas(tareas):
+    """Calcula las estadísticas de las tareas a partir de los contadores.
+
+    Las vencidas son las del día con que se contaron; al cambiar el día las
+    suma avanzar_dia (ver modelo.actualizar_vencidas).
+    """
+    total_tareas = contadores['total']
+    tareas_completadas = contadores['completadas']
+    tareas_pendientes = total_tareas - tareas_completadas
+    porcentaje = (tareas_completadas / total_tareas * 100) if total_tareas > 0 else 0
+    return {
+        'total': total_tareas,
+        'completadas': tareas_completadas,
+        'pendientes': tareas_pendientes,
+        'porcentaje': porcentaje,
+        'vencidas': contadores['vencidas'],
+        'por_categoria': dict(contadores['por_categoria'])
+    }
@@ -0,0 +1,32 @@
+"""Conversión de fechas de vencimiento y cálculo de tareas vencidas."""
+
+from datetime import datetime
+
+def dia_actual():
+    """Devuelve el número de día de hoy."""
+    return datetime.now().toordinal()
+
+def fecha_a_dia(fecha):
+    """Convierte una fecha "dd/mm/yyyy" en número de día, o None si no es válida."""
+    try:
+        return datetime.strptime(fecha, "%d/%m/%Y").toordinal()
+    except (TypeError, ValueError):
+        return None
+
+def dia_a_fecha(dia):
+    """Convierte un número de día en una fecha "dd/mm/yyyy"."""
+    return datetime.fromordinal(dia).strftime("%d/%m/%Y")
+
+def segundos_hasta_dia(dia):
+    """Devuelve cuántos segundos faltan para que empiece el día indicado (negativo si ya empezó)."""
+    return (datetime.fromordinal(dia) - datetime.now()).total_seconds()
+
+def es_tarea_vencida(tarea, hoy=None):
+    """Determina si una tarea (organizador.registro.Tarea) está vencida el día `hoy` (por defecto, el actual)."""
+    dia = tarea.dia
+    if dia is None:
+        return False
+    if hoy is None:
+        hoy = dia_actual()
+    # Una tarea vence al comenzar el día de su fecha de vencimiento
+    return hoy >= dia and not tarea.completada
@@ -0,0 +1,108 @@
+"""Índices por atributo para filtrar las tareas por categoría, estado y vencimiento.
+
+Los criterios de filtro son un dict con alguna de estas claves:
+'categoria', 'completada' (True o False), 'importante' (True), 'vencidas' (True),
+'desde' y 'hasta' (números de día de vencimiento, inclusive).
+"""
+
+import bisect
+
+from organizador.fechas import es_tarea_vencida
+from organizador.orden import agregar_ordenados
+
+# Índices de las tareas por atributo
+por_categoria = {}  # categoría -> ids
+por_estado = {True: set(), False: set()}  # completada -> ids
+importantes = set()
+por_dia = []  # (día de vencimiento, id) de las tareas con fecha válida, ordenados
+atributos_por_tarea = {}  # id -> (categoría, completada, importante, día) con que se indexó
+
+def desindexar_tarea(id_tarea):
+    """Quita una tarea de los índices."""
+    atributos = atributos_por_tarea.pop(id_tarea, None)
+    if atributos is None:
+        return
+    categoria, completada, importante, dia = atributos
+    ids = por_categoria[categoria]
+    ids.discard(id_tarea)
+    if not ids:
+        del por_categoria[categoria]
+    por_estado[completada].discard(id_tarea)
+    if importante:
+        importantes.discard(id_tarea)
+    if dia is not None:
+        del por_dia[bisect.bisect_left(por_dia, (dia, id_tarea))]
+
+def indexar_tareas(lista_tareas):
+    """Agrega o actualiza en los índices las tareas indicadas."""
+    nuevos = []
+    for tarea in lista_tareas:
+        id_tarea = tarea.id
+        desindexar_tarea(id_tarea)
+        atributos = (tarea.categoria, tarea.completada, tarea.importante, tarea.dia)
+        atributos_por_tarea[id_tarea] = atributos
+        categoria, completada, importante, dia = atributos
+        por_categoria.setdefault(categoria, set()).add(id_tarea)
+        por_estado[completada].add(id_tarea)
+        if importante:
+            importantes.add(id_tarea)
+        if dia is not None:
+            nuevos.append((dia, id_tarea))
+    if nuevos:
+        agregar_ordenados(por_dia, nuevos)
+
+def vaciar_indices():
+    """Quita todas las tareas de los índices."""
+    por_categoria.clear()
+    por_estado[True].clear()
+    por_estado[False].clear()
+    importantes.clear()
+    del por_dia[:]
+    atributos_por_tarea.clear()
+
+def _ids_entre_dias(desde, hasta):
+    """Devuelve los ids de las tareas que vencen entre los días indicados (None: sin límite)."""
+    inicio = 0 if desde is None else bisect.bisect_left(por_dia, (desde,))
+    fin = len(por_dia) if hasta is None else bisect.bisect_left(por_dia, (hasta + 1,), inicio)
+    return {id_tarea for _, id_tarea in por_dia[inicio:fin]}
+
+def filtrar(criterios, hoy):
+    """Devuelve los ids de las tareas que cumplen todos los criterios.
+
+    Devuelve None si no hay criterios, es decir, si no hay nada que filtrar.
+    """
+    conjuntos = []
+    if criterios.get('categoria') is not None:
+        conjuntos.append(por_categoria.get(criterios['categoria'], set()))
+    if criterios.get('completada') is not None:
+        conjuntos.append(por_estado[criterios['completada']])
+    if criterios.get('importante'):
+        conjuntos.append(importantes)
+    if criterios.get('vencidas'):
+        # Una tarea vence al comenzar el día de su fecha de vencimiento
+        conjuntos.append(_ids_entre_dias(None, hoy))
+        conjuntos.append(por_estado[False])
+    if criterios.get('desde') is not None or criterios.get('hasta') is not None:
+        conjuntos.append(_ids_entre_dias(criterios.get('desde'), criterios.get('hasta')))
+    if not conjuntos:
+        return None
+    # Intersecar empezando por el conjunto más chico
+    conjuntos.sort(key=len)
+    return conjuntos[0].intersection(*conjuntos[1:])
+
+def coincide(tarea, criterios, hoy):
+    """Indica si una tarea cumple todos los criterios."""
+    if criterios.get('categoria') is not None and tarea.categoria != criterios['categoria']:
+        return False
+    if criterios.get('completada') is not None and tarea.completada != criterios['completada']:
+        return False
+    if criterios.get('importante') and not tarea.importante:
+        return False
+    if criterios.get('vencidas') and not es_tarea_vencida(tarea, hoy):
+        return False
+    desde, hasta = criterios.get('desde'), criterios.get('hasta')
+    if desde is not None or hasta is not None:
+        dia = tarea.dia
+        if dia is None or (desde is not None and dia < desde) or (hasta is not None and dia > hasta):
+            return False
+    return True
@@ -0,0 +1,101 @@
+"""Medición de los tiempos de las operaciones principales, para encontrar demoras.
+
+Se activa con la variable de entorno TAREAS_INSTRUMENTACION=1; desactivada no
+agrega ningún costo, porque las funciones no se envuelven. Los intervalos
+medidos se guardan en un buffer circular y se pueden volcar a un archivo de
+traza en el formato de Chrome, que se abre con https://ui.perfetto.dev o
+chrome://tracing. Si se indica TAREAS_TRAZA, la traza se vuelca al salir.
+"""
+
+import collections
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+ACTIVA = os.environ.get("TAREAS_INSTRUMENTACION", "") not in ("", "0")
+ARCHIVO_TRAZA = os.environ.get("TAREAS_TRAZA")
+# Cantidad de intervalos que se conservan; los más viejos se descartan
+TAM_BUFFER = 20000
+
+# Intervalos medidos: (nombre, inicio, duración, hilo), en el orden en que terminaron
+intervalos = collections.deque(maxlen=TAM_BUFFER)
+
+def empezar():
+    """Devuelve el instante de inicio de un intervalo, o None si la medición está desactivada."""
+    return time.perf_counter() if ACTIVA else None
+
+def registrar(nombre, inicio):
+    """Registra el intervalo que empezó en `inicio` y termina ahora."""
+    if inicio is not None:
+        # deque.append es atómico, así que también se puede llamar desde el hilo escritor
+        intervalos.append((nombre, inicio, time.perf_counter() - inicio, threading.get_ident()))
+
+@contextlib.contextmanager
+def _intervalo(nombre):
+    """Registra la duración del bloque with que envuelve."""
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar(nombre, inicio)
+
+def medir(nombre):
+    """Mide lo que se ejecuta dentro de un bloque with."""
+    return _intervalo(nombre) if ACTIVA else contextlib.nullcontext()
+
+def medido(nombre=None):
+    """Decorador que mide cada llamada a la función (con su nombre, si no se indica otro)."""
+    def decorar(funcion):
+        if not ACTIVA:
+            return funcion
+        etiqueta = nombre or funcion.__name__
+
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                registrar(etiqueta, inicio)
+        return envoltura
+    return decorar
+
+def desglose(nombres):
+    """Devuelve el último intervalo con alguno de los nombres indicados y lo que contiene.
+
+    El resultado es (nombre, duración, [(nombre, cantidad, duración total), ...]),
+    con los intervalos internos agrupados por nombre, o None si no hay ninguno.
+    """
+    registros = list(intervalos)
+    for posicion in range(len(registros) - 1, -1, -1):
+        nombre, inicio, duracion, hilo = registros[posicion]
+        if nombre in nombres:
+            break
+    else:
+        return None
+
+    # Los intervalos internos terminaron antes, así que están justo antes en el buffer
+    fin = inicio + duracion
+    totales = {}
+    for interno, inicio_interno, duracion_interna, hilo_interno in reversed(registros[:posicion]):
+        if inicio_interno + duracion_interna < inicio:
+            break
+        if hilo_interno == hilo and inicio_interno >= inicio and inicio_interno + duracion_interna <= fin:
+            cantidad, total, primero = totales.get(interno, (0, 0.0, inicio_interno))
+            totales[interno] = (cantidad + 1, total + duracion_interna, min(primero, inicio_interno))
+    internos = sorted(totales.items(), key=lambda item: item[1][2])
+    return nombre, duracion, [(interno, cantidad, total) for interno, (cantidad, total, _) in internos]
+
+def volcar(ruta):
+    """Escribe los intervalos registrados en un archivo de traza de Chrome y devuelve cuántos son."""
+    proceso = os.getpid()
+    eventos = [
+        {"name": nombre, "ph": "X", "ts": inicio * 1e6, "dur": duracion * 1e6, "pid": proceso, "tid": hilo}
+        for nombre, inicio, duracion, hilo in list(intervalos)
+    ]
+    with open(ruta, "w") as f:
+        json.dump({"traceEvents": eventos, "displayTimeUnit": "ms"}, f)
+    return len(eventos)
@@ -0,0 +1,239 @@
+"""Importación y exportación de tareas en archivos CSV y JSONL.
+
+Los registros se leen de a lotes y se validan en varios procesos con las mismas
+reglas que los formularios; las tareas aceptadas se agregan todas juntas.
+
+Uso desde la línea de comandos:
+    python -m organizador.intercambio importar tareas.csv
+    python -m organizador.intercambio exportar tareas.jsonl [--archivadas]
+"""
+
+import argparse
+import collections
+import csv
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from organizador import almacenamiento, modelo
+from organizador.registro import a_dict
+from organizador.validacion import ErrorValidacion, validar_registro
+
+# Campos de las tareas, en el orden de las columnas del CSV
+CAMPOS = ["titulo", "descripcion", "completada", "categoria", "fecha_vencimiento", "importante"]
+# Cantidad de registros que valida un proceso por vez
+TAM_LOTE_VALIDACION = 2000
+
+_VERDADEROS = {"1", "true", "si", "sí", "verdadero", "x"}
+_FALSOS = {"", "0", "false", "no", "falso"}
+
+def _formato(ruta):
+    """Devuelve "csv" o "jsonl" según la extensión del archivo."""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Formato de archivo no soportado: {extension or ruta} (se espera .csv o .jsonl)")
+
+def _a_booleano(valor):
+    """Convierte un valor de un registro en booleano, o None si no se reconoce."""
+    if isinstance(valor, bool):
+        return valor
+    texto = "" if valor is None else str(valor).strip().casefold()
+    if texto in _VERDADEROS:
+        return True
+    if texto in _FALSOS:
+        return False
+    return None
+
+def _a_texto(valor):
+    """Convierte un campo de una tarea en el texto de su columna del CSV."""
+    if isinstance(valor, bool):
+        return "sí" if valor else "no"
+    return "" if valor is None else valor
+
+def registro_a_tarea(registro):
+    """Convierte un registro leído del archivo en una tarea.
+
+    Devuelve (tarea, []) si el registro es válido, o (None, errores) si no.
+    """
+    if isinstance(registro, str):
+        try:
+            registro = json.loads(registro)
+        except ValueError as error:
+            return None, [ErrorValidacion("registro", "json", f"JSON inválido: {error}")]
+    if not isinstance(registro, dict):
+        return None, [ErrorValidacion("registro", "tipo", "El registro debe ser un objeto con los campos de la tarea.")]
+
+    def texto(campo):
+        valor = registro.get(campo)
+        return "" if valor is None else valor.strip() if isinstance(valor, str) else valor
+
+    # Los ids del archivo no se conservan: las tareas reciben uno nuevo al agregarse
+    tarea = {
+        "id": None,
+        "titulo": texto("titulo"),
+        "descripcion": texto("descripcion"),
+        "completada": _a_booleano(registro.get("completada")),
+        "categoria": registro.get("categoria") or "General",
+        "fecha_vencimiento": texto("fecha_vencimiento"),
+        "importante": _a_booleano(registro.get("importante"))
+    }
+    errores = []
+    for campo in ("completada", "importante"):
+        if tarea[campo] is None:
+            errores.append(ErrorValidacion(campo, "booleano", f"Valor inválido para {campo}: {registro.get(campo)}"))
+    errores.extend(validar_registro(tarea))
+    if errores:
+        return None, errores
+    return tarea, []
+
+def _validar_lote(lote):
+    """Convierte y valida un lote de (línea, registro); se ejecuta en otro proceso.
+
+    Devuelve las tareas aceptadas y una lista de (línea, errores) con las rechazadas.
+    """
+    aceptadas = []
+    rechazadas = []
+    for numero, registro in lote:
+        tarea, errores = registro_a_tarea(registro)
+        if errores:
+            rechazadas.append((numero, errores))
+        else:
+            aceptadas.append(tarea)
+    return aceptadas, rechazadas
+
+def _leer_registros(ruta):
+    """Recorre los registros del archivo como (número de línea, registro sin convertir)."""
+    if _formato(ruta) == "csv":
+        with open(ruta, newline="", encoding="utf-8-sig") as f:
+            lector = csv.DictReader(f)
+            try:
+                for fila in lector:
+                    yield lector.line_num, fila
+            except csv.Error as error:
+                raise ValueError(f"CSV inválido en la línea {lector.line_num}: {error}")
+    else:
+        with open(ruta, encoding="utf-8") as f:
+            # Cada línea se decodifica en el proceso que la valida
+            for numero, linea in enumerate(f, start=1):
+                if linea.strip():
+                    yield numero, linea
+
+def _en_lotes(registros):
+    """Agrupa los registros en listas de TAM_LOTE_VALIDACION."""
+    registros = iter(registros)
+    while True:
+        lote = list(itertools.islice(registros, TAM_LOTE_VALIDACION))
+        if not lote:
+            return
+        yield lote
+
+def _validar_en_paralelo(lotes, procesos):
+    """Valida los lotes en varios procesos y devuelve sus resultados en orden.
+
+    Solo se mantienen en vuelo unos pocos lotes por proceso, para no leer el
+    archivo entero en memoria antes de validarlo.
+    """
+    with ProcessPoolExecutor(procesos) as ejecutor:
+        pendientes = collections.deque()
+        for lote in lotes:
+            pendientes.append(ejecutor.submit(_validar_lote, lote))
+            if len(pendientes) >= 2 * procesos:
+                yield pendientes.popleft().result()
+        while pendientes:
+            yield pendientes.popleft().result()
+
+def leer_tareas(ruta, procesos=None):
+    """Lee y valida las tareas de un archivo CSV o JSONL, sin agregarlas.
+
+    Devuelve la lista de tareas aceptadas y una lista de (línea, errores) con
+    los registros rechazados.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    lotes = _en_lotes(_leer_registros(ruta))
+    primeros = list(itertools.islice(lotes, 2))
+    if len(primeros) < 2 or procesos == 1:
+        # Para un solo lote no vale la pena iniciar otros procesos
+        resultados = map(_validar_lote, itertools.chain(primeros, lotes))
+    else:
+        resultados = _validar_en_paralelo(itertools.chain(primeros, lotes), procesos)
+    aceptadas = []
+    rechazadas = []
+    for lote_aceptadas, lote_rechazadas in resultados:
+        aceptadas.extend(lote_aceptadas)
+        rechazadas.extend(lote_rechazadas)
+    return aceptadas, rechazadas
+
+def importar_tareas(ruta, procesos=None):
+    """Importa las tareas válidas de un archivo CSV o JSONL en un solo lote.
+
+    Devuelve las tareas agregadas y una lista de (línea, errores) con los
+    registros rechazados.
+    """
+    aceptadas, rechazadas = leer_tareas(ruta, procesos)
+    if aceptadas:
+        aceptadas = modelo.agregar_tareas(aceptadas)
+    return aceptadas, rechazadas
+
+def exportar_tareas(ruta, lista_tareas=None):
+    """Escribe las tareas (por defecto, todas) en un archivo CSV o JSONL y devuelve cuántas escribió."""
+    formato = _formato(ruta)
+    if lista_tareas is None:
+        lista_tareas = modelo.tareas.values()
+    cantidad = 0
+    with open(ruta, "w", newline="", encoding="utf-8") as f:
+        if formato == "csv":
+            escritor = csv.writer(f)
+            escritor.writerow(["id"] + CAMPOS)
+            for tarea in lista_tareas:
+                escritor.writerow([tarea["id"]] + [_a_texto(tarea.get(campo)) for campo in CAMPOS])
+                cantidad += 1
+        else:
+            for tarea in lista_tareas:
+                f.write(json.dumps(tarea, ensure_ascii=False, default=a_dict) + "\n")
+                cantidad += 1
+    return cantidad
+
+def formatear_rechazadas(rechazadas):
+    """Devuelve una línea de texto por registro rechazado, con sus motivos."""
+    return [f"Línea {numero}: {'; '.join(error.mensaje for error in errores)}" for numero, errores in rechazadas]
+
+def main(argumentos=None):
+    """Importa o exporta tareas desde la línea de comandos."""
+    parser = argparse.ArgumentParser(prog="python -m organizador.intercambio",
+                                     description="Importa o exporta tareas en archivos CSV o JSONL.")
+    parser.add_argument("accion", choices=["importar", "exportar"])
+    parser.add_argument("archivo")
+    parser.add_argument("--procesos", type=int, help="procesos para validar (por defecto, uno por CPU)")
+    parser.add_argument("--archivadas", action="store_true", help="al exportar, incluye también las tareas archivadas")
+    argumentos = parser.parse_args(argumentos)
+
+    modelo.cargar()
+    if argumentos.accion == "exportar":
+        lista_tareas = list(modelo.tareas.values())
+        archivadas = modelo.tareas_archivadas()
+        if argumentos.archivadas:
+            lista_tareas += archivadas
+        cantidad = exportar_tareas(argumentos.archivo, lista_tareas)
+        # La carga pudo archivar tareas: sus cambios se escriben antes de terminar
+        almacenamiento.esperar_escrituras()
+        print(f"Se exportaron {cantidad} tareas a {argumentos.archivo}.")
+        if archivadas and not argumentos.archivadas:
+            print(f"No se incluyeron {len(archivadas)} tareas archivadas (se incluyen con --archivadas).")
+        return 0
+    aceptadas, rechazadas = importar_tareas(argumentos.archivo, argumentos.procesos)
+    almacenamiento.esperar_escrituras()
+    print(f"Se importaron {len(aceptadas)} tareas.")
+    if rechazadas:
+        print(f"Se rechazaron {len(rechazadas)} registros:", file=sys.stderr)
+        for linea in formatear_rechazadas(rechazadas):
+            print(linea, file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,999 @@
+"""Interfaz gráfica del Organizador de Tareas, construida sobre el núcleo de organizador."""
+
+import calendar
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+from datetime import date, datetime
+
+from organizador import almacenamiento, estadisticas, instrumentacion, intercambio, modelo
+from organizador.fechas import es_tarea_vencida, fecha_a_dia, segundos_hasta_dia
+from organizador.instrumentacion import medido
+from organizador.modelo import CATEGORIAS, tareas
+from organizador.validacion import validar_tarea
+
+# Alto en píxeles de cada fila de la lista de tareas
+ALTO_FILA = 32
+
+# Colores con los que se muestra cada categoría
+COLORES_CATEGORIAS = {
+    "General": "#808080",  # Gris
+    "Personal": "#4CAF50",  # Verde
+    "Trabajo": "#2196F3",  # Azul
+    "Estudio": "#FFC107"   # Amarillo
+}
+
+# Refrescos de la lista cuyo desglose de tiempos muestra el panel de instrumentación
+REFRESCOS_LISTA = {"actualizar_lista_tareas", "refrescar_tareas", "al_desplazar_lista",
+                   "al_escribir_busqueda", "al_cambiar_filtros", "cargar_bloque", "al_vencer_tareas",
+                   "revisar_cambios_externos"}
+panel_tiempos = None  # Label con el desglose, si está visible
+actualizacion_panel = None  # id del after que lo actualiza
+
+# Espera máxima en milisegundos del temporizador de vencimientos: si se cambia la
+# hora o se suspende la computadora, el temporizador se corrige a lo sumo en este tiempo
+ESPERA_MAXIMA_VENCIMIENTOS = 60 * 60 * 1000
+temporizador_vencimientos = None  # id del after que marca las tareas que vencen
+
+# Cada cuántos milisegundos se revisa si otra instancia modificó las tareas
+INTERVALO_CAMBIOS_EXTERNOS = 2000
+revision_cambios = None  # id del after que los revisa
+
+# Filas de la lista virtualizada
+filas_lista = []
+filas_por_tarea = {}  # id de la tarea -> fila que la muestra
+filas_libres = []
+# Bindtag de la lista y sus filas: la rueda del mouse sobre ellos desplaza la lista
+ETIQUETA_RUEDA = "RuedaLista"
+
+# Opciones del selector de fecha: los días se recortan a los del mes elegido
+DIAS_SELECTOR = [str(i).zfill(2) for i in range(1, 32)]
+MESES_SELECTOR = [str(i).zfill(2) for i in range(1, 13)]
+anios_selector = (None, [])  # (año en que se calcularon, años que se ofrecen)
+
+# Diálogos que se construyen una sola vez y se ocultan al cerrarlos
+formulario_agregar = None
+formulario_editar = None
+dialogo_detalles = None
+
+def opciones_anio(anio_actual):
+    """Devuelve los años que ofrece el selector de fecha, calculándolos una vez por año."""
+    global anios_selector
+    if anios_selector[0] != anio_actual:
+        anios_selector = (anio_actual, [str(i) for i in range(anio_actual, anio_actual + 10)])
+    return anios_selector[1]
+
+def ajustar_dias_selector(combo_dia, combo_mes, combo_anio):
+    """Limita los días que ofrece el selector a los del mes y año elegidos."""
+    try:
+        ultimo = calendar.monthrange(int(combo_anio.get()), int(combo_mes.get()))[1]
+    except ValueError:
+        return
+    combo_dia.config(values=DIAS_SELECTOR[:ultimo])
+    if combo_dia.get().isdigit() and int(combo_dia.get()) > ultimo:
+        combo_dia.set(DIAS_SELECTOR[ultimo - 1])
+
+def crear_selector_fecha(parent):
+    """Crea un frame con campos para seleccionar día, mes y año."""
+    frame = tk.Frame(parent)
+    
+    # Comboboxes
+    combo_dia = ttk.Combobox(frame, values=DIAS_SELECTOR, width=3, state="readonly")
+    combo_mes = ttk.Combobox(frame, values=MESES_SELECTOR, width=3, state="readonly")
+    combo_anio = ttk.Combobox(frame, width=5, state="readonly")
+    
+    # Al cambiar el mes o el año solo se pueden elegir los días que tiene ese mes
+    def ajustar(evento):
+        ajustar_dias_selector(combo_dia, combo_mes, combo_anio)
+    combo_mes.bind("<<ComboboxSelected>>", ajustar)
+    combo_anio.bind("<<ComboboxSelected>>", ajustar)
+    
+    # Layout
+    combo_dia.pack(side=tk.LEFT, padx=2)
+    tk.Label(frame, text="/").pack(side=tk.LEFT)
+    combo_mes.pack(side=tk.LEFT, padx=2)
+    tk.Label(frame, text="/").pack(side=tk.LEFT)
+    combo_anio.pack(side=tk.LEFT, padx=2)
+    
+    return frame, combo_dia, combo_mes, combo_anio
+
+def establecer_fecha_selector(combo_dia, combo_mes, combo_anio, fecha=None):
+    """Muestra en el selector la fecha "dd/mm/aaaa" indicada, o la de hoy si no hay una."""
+    hoy = date.today()
+    combo_anio.config(values=opciones_anio(hoy.year))
+    combo_dia.set(str(hoy.day).zfill(2))
+    combo_mes.set(str(hoy.month).zfill(2))
+    combo_anio.set(str(hoy.year))
+    if fecha:
+        try:
+            dia, mes, anio = fecha.split('/')
+            combo_dia.set(dia)
+            combo_mes.set(mes)
+            combo_anio.set(anio)
+        except ValueError:
+            pass
+    ajustar_dias_selector(combo_dia, combo_mes, combo_anio)
+
+def abrir_dialogo(dialogo):
+    """Muestra un diálogo ya construido, modal sobre la ventana principal."""
+    dialogo.deiconify()
+    dialogo.lift()
+    dialogo.wait_visibility()
+    dialogo.grab_set()
+
+def cerrar_dialogo(dialogo):
+    """Oculta un diálogo para volver a mostrarlo la próxima vez que se abra."""
+    dialogo.grab_release()
+    dialogo.withdraw()
+
+def crear_formulario_tarea(titulo_ventana, texto_boton, al_confirmar):
+    """Construye, oculto, un formulario con los campos de una tarea y devuelve sus widgets."""
+    dialogo = tk.Toplevel(ventana)
+    dialogo.withdraw()
+    dialogo.title(titulo_ventana)
+    dialogo.geometry("400x400")
+    dialogo.transient(ventana)
+    dialogo.protocol("WM_DELETE_WINDOW", lambda: cerrar_dialogo(dialogo))
+    
+    # Configurar el grid para que sea expansible
+    dialogo.grid_columnconfigure(1, weight=1)
+    dialogo.grid_rowconfigure(1, weight=1)
+    
+    # Frame principal para el contenido
+    frame_contenido = tk.Frame(dialogo)
+    frame_contenido.grid(row=0, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
+    frame_contenido.grid_columnconfigure(1, weight=1)
+    
+    # Campos del formulario
+    etiqueta_titulo = tk.Label(frame_contenido, text="Título:")
+    etiqueta_titulo.grid(row=0, column=0, padx=5, pady=5, sticky="w")
+    entrada_titulo = tk.Entry(frame_contenido)
+    entrada_titulo.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+    
+    etiqueta_descripcion = tk.Label(frame_contenido, text="Descripción:")
+    etiqueta_descripcion.grid(row=1, column=0, padx=5, pady=5, sticky="w")
+    entrada_descripcion = tk.Text(frame_contenido, height=5)
+    entrada_descripcion.grid(row=1, column=1, padx=5, pady=5, sticky="nsew")
+    
+    # Campo de categoría
+    etiqueta_categoria = tk.Label(frame_contenido, text="Categoría:")
+    etiqueta_categoria.grid(row=2, column=0, padx=5, pady=5, sticky="w")
+    combo_categoria = ttk.Combobox(frame_contenido, values=CATEGORIAS, state="readonly")
+    combo_categoria.grid(row=2, column=1, padx=5, pady=5, sticky="ew")
+    
+    # Campo de fecha de vencimiento
+    etiqueta_fecha = tk.Label(frame_contenido, text="Fecha de vencimiento:")
+    etiqueta_fecha.grid(row=3, column=0, padx=5, pady=5, sticky="w")
+    frame_fecha, combo_dia, combo_mes, combo_anio = crear_selector_fecha(frame_contenido)
+    frame_fecha.grid(row=3, column=1, padx=5, pady=5, sticky="w")
+    
+    # Frame para los botones
+    frame_botones = tk.Frame(dialogo)
+    frame_botones.grid(row=1, column=0, columnspan=2, pady=10, sticky="s")
+    
+    boton_confirmar = tk.Button(frame_botones, text=texto_boton, command=al_confirmar)
+    boton_confirmar.pack(side=tk.LEFT, padx=5)
+    boton_cancelar = tk.Button(frame_botones, text="Cancelar", command=lambda: cerrar_dialogo(dialogo))
+    boton_cancelar.pack(side=tk.LEFT, padx=5)
+    
+    return {
+        'dialogo': dialogo,
+        'entrada_titulo': entrada_titulo,
+        'entrada_descripcion': entrada_descripcion,
+        'combo_categoria': combo_categoria,
+        'fecha': (combo_dia, combo_mes, combo_anio),
+        'id_tarea': None  # tarea que se está editando
+    }
+
+def llenar_formulario(formulario, titulo, descripcion, categoria, fecha):
+    """Carga en un formulario ya construido los datos de la tarea."""
+    formulario['entrada_titulo'].delete(0, tk.END)
+    formulario['entrada_titulo'].insert(0, titulo)
+    formulario['entrada_descripcion'].delete("1.0", tk.END)
+    formulario['entrada_descripcion'].insert("1.0", descripcion)
+    formulario['combo_categoria'].set(categoria)
+    establecer_fecha_selector(*formulario['fecha'], fecha)
+
+def leer_formulario(formulario):
+    """Devuelve (título, descripción, categoría, fecha) ingresados en un formulario."""
+    combo_dia, combo_mes, combo_anio = formulario['fecha']
+    return (formulario['entrada_titulo'].get().strip(),
+            formulario['entrada_descripcion'].get("1.0", tk.END).strip(),
+            formulario['combo_categoria'].get(),
+            f"{combo_dia.get()}/{combo_mes.get()}/{combo_anio.get()}")
+
+def guardar_nueva_tarea():
+    """Agrega la tarea ingresada en el formulario de agregar."""
+    titulo, descripcion, categoria, fecha = leer_formulario(formulario_agregar)
+    
+    errores = validar_tarea(titulo, descripcion)
+    if errores:
+        messagebox.showwarning("Advertencia", errores[0].mensaje)
+        return
+    nueva_tarea = modelo.agregar_tarea(titulo, descripcion, categoria, fecha)
+    refrescar_tareas(nueva_tarea.id)
+    cerrar_dialogo(formulario_agregar['dialogo'])
+
+def guardar_tarea_editada():
+    """Guarda los cambios ingresados en el formulario de editar."""
+    id_tarea = formulario_editar['id_tarea']
+    titulo, descripcion, categoria, fecha = leer_formulario(formulario_editar)
+    
+    errores = validar_tarea(titulo, descripcion)
+    if errores:
+        messagebox.showwarning("Advertencia", errores[0].mensaje)
+        return
+    if id_tarea not in tareas:
+        cerrar_dialogo(formulario_editar['dialogo'])
+        messagebox.showwarning("Advertencia", "La tarea fue eliminada desde otra ventana.")
+        return
+    modelo.actualizar_tarea(id_tarea, {
+        'titulo': titulo,
+        'descripcion': descripcion,
+        'categoria': categoria,
+        'fecha_vencimiento': fecha
+    })
+    refrescar_tareas(id_tarea)
+    resaltar_tarea(id_tarea)
+    cerrar_dialogo(formulario_editar['dialogo'])
+    messagebox.showinfo("Información", "Tarea actualizada correctamente.")
+
+def crear_dialogo_detalles():
+    """Construye, oculta, la ventana de detalles de una tarea y devuelve sus widgets."""
+    dialogo = tk.Toplevel(ventana)
+    dialogo.withdraw()
+    dialogo.title("Detalles de la Tarea")
+    dialogo.geometry("400x300")
+    dialogo.transient(ventana)
+    dialogo.protocol("WM_DELETE_WINDOW", lambda: cerrar_dialogo(dialogo))
+    
+    # Configurar el grid
+    dialogo.grid_columnconfigure(1, weight=1)
+    dialogo.grid_rowconfigure(1, weight=1)
+    
+    # Frame para el contenido
+    frame_contenido = tk.Frame(dialogo)
+    frame_contenido.grid(row=0, column=0, padx=10, pady=5, sticky="nsew")
+    
+    # Estado
+    etiqueta_estado = tk.Label(frame_contenido, font=("Arial", 10, "bold"))
+    etiqueta_estado.grid(row=0, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+    
+    # Título
+    etiqueta_titulo = tk.Label(frame_contenido, text="Título:", font=("Arial", 10, "bold"))
+    etiqueta_titulo.grid(row=1, column=0, padx=5, pady=5, sticky="w")
+    texto_titulo = tk.Label(frame_contenido, wraplength=300)
+    texto_titulo.grid(row=1, column=1, padx=5, pady=5, sticky="w")
+    
+    # Descripción
+    etiqueta_descripcion = tk.Label(frame_contenido, text="Descripción:", font=("Arial", 10, "bold"))
+    etiqueta_descripcion.grid(row=2, column=0, padx=5, pady=5, sticky="w")
+    texto_descripcion = tk.Label(frame_contenido, wraplength=300)
+    texto_descripcion.grid(row=2, column=1, padx=5, pady=5, sticky="w")
+    
+    # Botón cerrar
+    boton_cerrar = tk.Button(dialogo, text="Cerrar", command=lambda: cerrar_dialogo(dialogo))
+    boton_cerrar.grid(row=3, column=0, pady=10)
+    
+    return {
+        'dialogo': dialogo,
+        'etiqueta_estado': etiqueta_estado,
+        'texto_titulo': texto_titulo,
+        'texto_descripcion': texto_descripcion
+    }
+
+@medido()
+def crear_dialogos():
+    """Construye de antemano, ocultos, los diálogos de agregar, editar y ver una tarea."""
+    global formulario_agregar, formulario_editar, dialogo_detalles
+    formulario_agregar = crear_formulario_tarea("Agregar Nueva Tarea", "Guardar", guardar_nueva_tarea)
+    formulario_editar = crear_formulario_tarea("Editar Tarea", "Actualizar", guardar_tarea_editada)
+    dialogo_detalles = crear_dialogo_detalles()
+
+def mostrar_formulario_agregar():
+    """Muestra el formulario para agregar una nueva tarea."""
+    inicio = instrumentacion.empezar()
+    llenar_formulario(formulario_agregar, "", "", "General", None)
+    abrir_dialogo(formulario_agregar['dialogo'])
+    formulario_agregar['entrada_titulo'].focus_set()
+    instrumentacion.registrar("abrir_formulario_agregar", inicio)
+
+def mostrar_formulario_editar(id_tarea):
+    """Muestra el formulario para editar una tarea existente."""
+    tarea = tareas[id_tarea]
+    if tarea.completada:
+        messagebox.showwarning("Advertencia", "La tarea necesita estar en estado no completado para poder editar.")
+        return
+    
+    inicio = instrumentacion.empezar()
+    formulario_editar['id_tarea'] = id_tarea
+    llenar_formulario(formulario_editar, tarea.titulo, tarea.descripcion,
+                      tarea.categoria, tarea.fecha_vencimiento)
+    abrir_dialogo(formulario_editar['dialogo'])
+    formulario_editar['entrada_titulo'].focus_set()
+    instrumentacion.registrar("abrir_formulario_editar", inicio)
+
+def resaltar_tarea(id_tarea):
+    """Resalta brevemente una tarea después de ser editada."""
+    fila = filas_por_tarea.get(id_tarea)
+    if fila is not None:
+        for widget in (fila['checkbox'], fila['boton_importante'], fila['boton_titulo']):
+            color_original = widget.cget('bg')
+            widget.config(bg='#b3e6b3')  # Color verde claro para resaltar
+            frame_lista.after(1000, lambda w=widget, c=color_original: w.config(bg=c))
+
+def confirmar_eliminar(id_tarea):
+    """Muestra un diálogo de confirmación antes de eliminar una tarea."""
+    tarea = tareas[id_tarea]
+    respuesta = messagebox.askyesno("Confirmar",
+                                 f"¿Eliminar esta tarea?\n\"{tarea.titulo}\"\nEsta acción no se puede deshacer.")
+    # Otra instancia pudo haberla eliminado mientras se confirmaba
+    if respuesta and id_tarea in tareas:
+        modelo.eliminar_tarea(id_tarea)
+        refrescar_tareas(id_tarea)
+
+def mostrar_detalles_tarea(tarea):
+    """Muestra una ventana con los detalles de la tarea seleccionada."""
+    inicio = instrumentacion.empezar()
+    estado = "Completada" if tarea.completada else "Pendiente"
+    dialogo_detalles['etiqueta_estado'].config(text=f"Estado: {estado}")
+    dialogo_detalles['texto_titulo'].config(text=tarea.titulo)
+    dialogo_detalles['texto_descripcion'].config(text=tarea.descripcion)
+    abrir_dialogo(dialogo_detalles['dialogo'])
+    instrumentacion.registrar("abrir_detalles_tarea", inicio)
+
+def toggle_completada(id_tarea):
+    """Alterna el estado de completada de una tarea."""
+    modelo.alternar_completada(id_tarea)
+    refrescar_tareas(id_tarea)
+
+@medido()
+def actualizar_estadisticas():
+    """Actualiza la visualización de las estadísticas."""
+    stats = estadisticas.calcular_estadisticas(tareas)
+    
+    # Actualizar etiquetas
+    label_total.config(text=f"Total de Tareas: {stats['total']}")
+    label_completadas.config(text=f"Tareas Completadas: {stats['completadas']}")
+    label_pendientes.config(text=f"Tareas Pendientes: {stats['pendientes']}")
+    label_porcentaje.config(text=f"Porcentaje de Avance: {stats['porcentaje']:.1f}%")
+    label_vencidas.config(text=f"Tareas Vencidas: {stats['vencidas']}")
+    categorias = CATEGORIAS + sorted(c for c in stats['por_categoria'] if c not in CATEGORIAS)
+    label_categorias.config(text="  ".join(f"{c}: {stats['por_categoria'].get(c, 0)}" for c in categorias))
+    
+    # Actualizar barra de progreso
+    barra_progreso['value'] = stats['porcentaje']
+
+def mostrar_archivo():
+    """Muestra las tareas archivadas, leyendo el archivo recién ahora, y permite restaurarlas."""
+    archivadas = modelo.tareas_archivadas()
+    dialogo = tk.Toplevel(ventana)
+    dialogo.title("Tareas Archivadas")
+    dialogo.geometry("520x360")
+    dialogo.grid_columnconfigure(0, weight=1)
+    dialogo.grid_rowconfigure(1, weight=1)
+
+    tk.Label(dialogo, text=f"Tareas completadas hace más de {modelo.DIAS_ARCHIVO} días: {len(archivadas)}",
+             font=("Arial", 10, "bold")).grid(row=0, column=0, columnspan=2, padx=10, pady=5, sticky="w")
+
+    tabla = ttk.Treeview(dialogo, columns=("titulo", "categoria", "completada_en"), show="headings")
+    tabla.heading("titulo", text="Título")
+    tabla.heading("categoria", text="Categoría")
+    tabla.heading("completada_en", text="Completada el")
+    tabla.column("titulo", width=280)
+    tabla.column("categoria", width=90)
+    tabla.column("completada_en", width=100)
+    tabla.grid(row=1, column=0, padx=(10, 0), sticky="nsew")
+    barra = tk.Scrollbar(dialogo, orient=tk.VERTICAL, command=tabla.yview)
+    barra.grid(row=1, column=1, padx=(0, 10), sticky="ns")
+    tabla.configure(yscrollcommand=barra.set)
+
+    # Las filas se identifican con la posición de la tarea en archivadas
+    for posicion, tarea in enumerate(archivadas):
+        tabla.insert("", tk.END, iid=str(posicion),
+                     values=(tarea.get('titulo', ''), tarea.get('categoria', ''), tarea.get('completada_en', '')))
+
+    def restaurar():
+        seleccion = tabla.selection()
+        if not seleccion:
+            messagebox.showwarning("Advertencia", "Selecciona las tareas a restaurar.", parent=dialogo)
+            return
+        restauradas = []
+        try:
+            for fila in seleccion:
+                restauradas.append(modelo.restaurar_tarea(archivadas[int(fila)]))
+                tabla.delete(fila)
+        except OSError as error:
+            # La tarea quedó en la lista pero no se pudo guardar: se reintenta con las demás escrituras
+            messagebox.showerror("Error", f"No se pudo guardar la tarea restaurada:\n{error}", parent=dialogo)
+            actualizar_lista_tareas()
+            return
+        refrescar_tareas(*(tarea.id for tarea in restauradas))
+
+    frame_botones = tk.Frame(dialogo)
+    frame_botones.grid(row=2, column=0, columnspan=2, pady=10)
+    tk.Button(frame_botones, text="Restaurar como pendiente", command=restaurar).pack(side=tk.LEFT, padx=5)
+    tk.Button(frame_botones, text="Cerrar", command=dialogo.destroy).pack(side=tk.LEFT, padx=5)
+
+    dialogo.transient(ventana)
+    dialogo.grab_set()
+    ventana.wait_window(dialogo)
+
+def toggle_importante(id_tarea):
+    """Alterna el estado de importante de una tarea."""
+    modelo.alternar_importante(id_tarea)
+    refrescar_tareas(id_tarea)
+
+def vaciar_lista():
+    """Vacía la lista de tareas después de confirmación."""
+    if not tareas:
+        messagebox.showinfo("Información", "La lista ya está vacía.")
+        return
+        
+    respuesta = messagebox.askyesno("Confirmar",
+                                  "¿Estás seguro de que deseas eliminar todas las tareas?\nEsta acción no se puede deshacer.")
+    if respuesta:
+        modelo.vaciar_tareas()
+        actualizar_lista_tareas()
+        messagebox.showinfo("Información", "Lista vaciada correctamente.")
+
+def importar_archivo():
+    """Importa tareas desde un archivo CSV o JSONL e informa los registros rechazados."""
+    ruta = filedialog.askopenfilename(title="Importar tareas", parent=ventana,
+                                      filetypes=[("CSV o JSONL", "*.csv *.jsonl *.ndjson"), ("Todos los archivos", "*")])
+    if not ruta:
+        return
+    ventana.config(cursor="watch")
+    ventana.update_idletasks()
+    try:
+        aceptadas, rechazadas = intercambio.importar_tareas(ruta)
+    except (OSError, ValueError) as error:
+        messagebox.showerror("Error", f"No se pudo importar el archivo:\n{error}")
+        return
+    finally:
+        ventana.config(cursor="")
+    actualizar_lista_tareas()
+
+    mensaje = f"Se importaron {len(aceptadas)} tareas."
+    if rechazadas:
+        lineas = intercambio.formatear_rechazadas(rechazadas)
+        mensaje += f"\n\nSe rechazaron {len(rechazadas)} registros:\n" + "\n".join(lineas[:10])
+        if len(lineas) > 10:
+            mensaje += f"\n... y {len(lineas) - 10} más."
+    messagebox.showinfo("Importar tareas", mensaje)
+
+def exportar_archivo():
+    """Exporta todas las tareas de la lista, sin las archivadas, a un archivo CSV o JSONL."""
+    ruta = filedialog.asksaveasfilename(title="Exportar tareas", parent=ventana, defaultextension=".csv",
+                                        filetypes=[("CSV", "*.csv"), ("JSONL", "*.jsonl")])
+    if not ruta:
+        return
+    try:
+        cantidad = intercambio.exportar_tareas(ruta)
+    except (OSError, ValueError) as error:
+        messagebox.showerror("Error", f"No se pudo exportar el archivo:\n{error}")
+        return
+    messagebox.showinfo("Exportar tareas", f"Se exportaron {cantidad} tareas (sin las tareas archivadas).")
+
+@medido()
+def crear_fila():
+    """Crea los widgets de una fila de la lista, para reutilizarla con distintas tareas."""
+    frame_tarea = tk.Frame(canvas_lista)
+    
+    # Checkbox para estado completado
+    var_check = tk.BooleanVar()
+    checkbox = tk.Checkbutton(frame_tarea, variable=var_check, indicatoron=False, width=2)
+    checkbox.grid(row=0, column=0, padx=(0, 5))
+    
+    # Ícono de estrella para importante
+    var_importante = tk.BooleanVar()
+    boton_importante = tk.Checkbutton(frame_tarea, variable=var_importante, indicatoron=False, width=2)
+    boton_importante.grid(row=0, column=1, padx=(0, 5))
+    
+    # Frame para título y fecha
+    frame_info = tk.Frame(frame_tarea)
+    frame_info.grid(row=0, column=2, sticky="ew")
+    
+    etiqueta_categoria = tk.Label(frame_info, fg="white", font=("Arial", 8))
+    etiqueta_categoria.pack(side=tk.LEFT, padx=(0, 5))
+    
+    boton_titulo = tk.Button(frame_info, anchor="w", relief="flat", cursor="hand2")
+    boton_titulo.pack(side=tk.LEFT, fill=tk.X, expand=True)
+    
+    etiqueta_fecha = tk.Label(frame_info, font=("Arial", 8))
+    
+    # Botones de acción
+    frame_botones = tk.Frame(frame_tarea)
+    frame_botones.grid(row=0, column=3, padx=(5, 0))
+    
+    boton_editar = tk.Button(frame_botones, text="✏️")
+    boton_editar.pack(side=tk.LEFT, padx=2)
+    
+    boton_eliminar = tk.Button(frame_botones, text="🗑️")
+    boton_eliminar.pack(side=tk.LEFT, padx=2)
+    
+    # Configurar el grid para que el título ocupe el espacio disponible
+    frame_tarea.grid_columnconfigure(2, weight=1)
+    recibir_rueda(frame_tarea, checkbox, boton_importante, frame_info, etiqueta_categoria, boton_titulo,
+                  etiqueta_fecha, frame_botones, boton_editar, boton_eliminar)
+    
+    item = canvas_lista.create_window(0, -ALTO_FILA, window=frame_tarea, anchor="nw",
+                                      width=max(canvas_lista.winfo_width() - 10, 1), height=ALTO_FILA - 4)
+    fila = {
+        'item': item,
+        'tarea': None,
+        'posicion': None,
+        'var_check': var_check,
+        'checkbox': checkbox,
+        'var_importante': var_importante,
+        'boton_importante': boton_importante,
+        'frame_info': frame_info,
+        'etiqueta_categoria': etiqueta_categoria,
+        'boton_titulo': boton_titulo,
+        'etiqueta_fecha': etiqueta_fecha,
+        'boton_editar': boton_editar,
+        'boton_eliminar': boton_eliminar
+    }
+    filas_lista.append(fila)
+    return fila
+
+@medido()
+def pintar_fila(fila, tarea, hoy):
+    """Muestra en una fila reutilizable los datos de la tarea."""
+    fila['tarea'] = tarea
+    vencida = es_tarea_vencida(tarea, hoy)
+    
+    # Estilo base según estado
+    estilo_base = {
+        'bg': '#f0f0f0' if tarea.completada else '#e6f2ff',
+        'fg': 'gray' if tarea.completada else 'black'
+    }
+    
+    # Ajustar estilo si está vencida
+    if vencida:
+        estilo_base.update({'fg': 'red'})
+    
+    fila['var_check'].set(tarea.completada)
+    fila['checkbox'].config(command=lambda id_tarea=tarea.id: toggle_completada(id_tarea),
+                            text="✓" if tarea.completada else " ",
+                            selectcolor="#f0f0f0" if tarea.completada else "#e6f2ff")
+    
+    importante = tarea.importante
+    fila['var_importante'].set(importante)
+    fila['boton_importante'].config(command=lambda id_tarea=tarea.id: toggle_importante(id_tarea),
+                                    text="★" if importante else "☆",
+                                    fg="gold" if importante else "gray")
+    
+    fila['frame_info'].config(bg=estilo_base['bg'])
+    
+    # Título con categoría
+    categoria = tarea.categoria
+    fila['etiqueta_categoria'].config(text=f" [{categoria}] ",
+                                      bg=COLORES_CATEGORIAS.get(categoria, "#808080"))
+    fila['boton_titulo'].config(text=tarea.titulo,
+                                bg=estilo_base['bg'],
+                                fg=estilo_base['fg'],
+                                command=lambda t=tarea: mostrar_detalles_tarea(t))
+    
+    # Fecha de vencimiento
+    fecha = tarea.fecha_vencimiento
+    if fecha:
+        fila['etiqueta_fecha'].config(text=f"Vence: {fecha}",
+                                      fg='red' if vencida else 'gray',
+                                      bg=estilo_base['bg'])
+        fila['etiqueta_fecha'].pack(side=tk.RIGHT, padx=5)
+    else:
+        fila['etiqueta_fecha'].pack_forget()
+    
+    fila['boton_editar'].config(command=lambda id_tarea=tarea.id: mostrar_formulario_editar(id_tarea))
+    fila['boton_eliminar'].config(command=lambda id_tarea=tarea.id: confirmar_eliminar(id_tarea))
+
+@medido()
+def renderizar_filas_visibles(sucias=None):
+    """Muestra solo las filas que entran en el área visible, reutilizando los widgets.
+
+    Cada fila queda asociada a su tarea mientras siga visible: solo se vuelven a
+    pintar las filas nuevas y las de las tareas en `sucias` (todas si es None);
+    las demás solo se mueven si cambió su posición. Las tareas que vencen al
+    cambiar el día llegan en `sucias` desde al_vencer_tareas.
+    """
+    hoy = modelo.dia_orden
+    primera = max(0, int(canvas_lista.canvasy(0)) // ALTO_FILA)
+    cantidad = canvas_lista.winfo_height() // ALTO_FILA + 2
+    visibles = modelo.tareas_en_orden(primera, primera + cantidad)
+    
+    # Liberar las filas de tareas que salieron del área visible o fueron eliminadas
+    claves_visibles = {tarea.id for tarea in visibles}
+    for clave in [c for c in filas_por_tarea if c not in claves_visibles]:
+        fila = filas_por_tarea.pop(clave)
+        canvas_lista.coords(fila['item'], 5, -ALTO_FILA)
+        fila['tarea'] = None
+        fila['posicion'] = None
+        filas_libres.append(fila)
+    
+    for k, tarea in enumerate(visibles):
+        i = primera + k
+        fila = filas_por_tarea.get(tarea.id)
+        if fila is None:
+            fila = filas_libres.pop() if filas_libres else crear_fila()
+            filas_por_tarea[tarea.id] = fila
+            pintar_fila(fila, tarea, hoy)
+        elif sucias is None or tarea.id in sucias or fila['tarea'] is not tarea:
+            pintar_fila(fila, tarea, hoy)
+        if fila['posicion'] != i:
+            canvas_lista.coords(fila['item'], 5, i * ALTO_FILA + 2)
+            fila['posicion'] = i
+
+@medido()
+def al_desplazar_lista(primero, ultimo):
+    """Sincroniza la barra de desplazamiento y vuelve a pintar las filas visibles."""
+    barra_lista.set(primero, ultimo)
+    renderizar_filas_visibles(sucias=())
+
+def al_redimensionar_lista(evento):
+    """Ajusta el ancho de las filas al del canvas."""
+    for fila in filas_lista:
+        canvas_lista.itemconfigure(fila['item'], width=max(evento.width - 10, 1))
+    renderizar_filas_visibles(sucias=())
+
+def recibir_rueda(*widgets):
+    """Hace que la rueda del mouse sobre los widgets desplace la lista, y no en otras ventanas."""
+    for widget in widgets:
+        widget.bindtags((ETIQUETA_RUEDA,) + widget.bindtags())
+
+def al_girar_rueda(evento):
+    """Desplaza la lista con la rueda del mouse."""
+    if evento.num == 4 or evento.delta > 0:
+        canvas_lista.yview_scroll(-1, "units")
+    else:
+        canvas_lista.yview_scroll(1, "units")
+
+@medido()
+def ajustar_area_lista():
+    """Ajusta el área desplazable del canvas a la cantidad de tareas."""
+    cantidad = modelo.cantidad_en_lista()
+    if cantidad:
+        canvas_lista.itemconfigure(texto_vacio, state="hidden")
+    else:
+        mensaje = "Ninguna tarea coincide con la búsqueda y los filtros." if tareas else "No hay tareas creadas."
+        canvas_lista.itemconfigure(texto_vacio, text=mensaje, state="normal")
+    # El área desplazable tiene el alto de todas las filas, pero solo se crean las visibles
+    canvas_lista.configure(scrollregion=(0, 0, 0, cantidad * ALTO_FILA))
+
+def mostrar_filtradas():
+    """Vuelve a mostrar la lista desde el principio después de cambiar la búsqueda o los filtros."""
+    canvas_lista.yview_moveto(0)
+    ajustar_area_lista()
+    renderizar_filas_visibles(sucias=())
+
+@medido()
+def al_escribir_busqueda(*args):
+    """Filtra la lista a medida que se escribe en el campo de búsqueda."""
+    modelo.buscar_tareas(texto_busqueda.get())
+    mostrar_filtradas()
+
+@medido()
+def al_cambiar_filtros(*args):
+    """Filtra la lista según los controles de categoría, estado, importancia y vencimiento."""
+    criterios = {}
+    if filtro_categoria.get() in CATEGORIAS:
+        criterios['categoria'] = filtro_categoria.get()
+    if filtro_estado.get() != "Todas":
+        criterios['completada'] = filtro_estado.get() == "Completadas"
+    if filtro_importantes.get():
+        criterios['importante'] = True
+    if filtro_vencidas.get():
+        criterios['vencidas'] = True
+    for clave, variable, entrada in (("desde", filtro_desde, entrada_desde), ("hasta", filtro_hasta, entrada_hasta)):
+        texto = variable.get().strip()
+        dia = fecha_a_dia(texto) if texto else None
+        # Una fecha incompleta o inválida no filtra, pero se marca en rojo
+        entrada.config(fg="red" if texto and dia is None else "black")
+        if dia is not None:
+            criterios[clave] = dia
+    modelo.filtrar_tareas(criterios)
+    mostrar_filtradas()
+
+@medido()
+def actualizar_lista_tareas():
+    """Actualiza la visualización de la lista de tareas."""
+    ajustar_area_lista()
+    renderizar_filas_visibles()
+    
+    # Actualizar estadísticas después de actualizar la lista
+    actualizar_estadisticas()
+    programar_vencimientos()
+
+@medido()
+def refrescar_tareas(*ids):
+    """Actualiza la lista después de agregar, modificar o eliminar las tareas indicadas."""
+    ajustar_area_lista()
+    renderizar_filas_visibles(set(ids))
+    actualizar_estadisticas()
+    # Una tarea nueva o editada puede vencer antes que las demás
+    programar_vencimientos()
+
+def programar_vencimientos():
+    """Programa el temporizador para el comienzo del día del próximo vencimiento."""
+    global temporizador_vencimientos
+    if temporizador_vencimientos is not None:
+        ventana.after_cancel(temporizador_vencimientos)
+    espera = ESPERA_MAXIMA_VENCIMIENTOS
+    dia = modelo.proximo_vencimiento()
+    if dia is not None:
+        espera = min(espera, max(0, int(segundos_hasta_dia(dia) * 1000) + 1))
+    temporizador_vencimientos = ventana.after(espera, al_vencer_tareas)
+
+@medido()
+def al_vencer_tareas():
+    """Marca las tareas que vencieron desde el último cambio de día, archiva las completadas y repinta solo esas."""
+    global temporizador_vencimientos
+    temporizador_vencimientos = None
+    vencidas = modelo.actualizar_vencidas()
+    # Con el día nuevo pueden cumplir su plazo tareas completadas
+    archivadas = modelo.archivar_completadas()
+    if vencidas is None:
+        # El reloj retrocedió y se recalculó todo
+        actualizar_lista_tareas()
+    elif vencidas or archivadas:
+        refrescar_tareas(*vencidas, *archivadas)
+    else:
+        programar_vencimientos()
+
+@medido()
+def revisar_cambios_externos():
+    """Incorpora los cambios que otra instancia guardó y repinta solo las tareas afectadas."""
+    global revision_cambios
+    revision_cambios = None
+    # Con un diálogo abierto se espera a que se cierre, para no cambiarle la tarea que muestra
+    if ventana.grab_current() is None and almacenamiento.hay_cambios_externos():
+        try:
+            afectadas = modelo.incorporar_cambios_externos()
+        except almacenamiento.ArchivoCorruptoError as error:
+            messagebox.showwarning("Advertencia", f"{error}.\nSe conservan y se guardan las tareas en memoria.")
+        except OSError:
+            # No se pudieron escribir los cambios propios: se informa abajo y se vuelve a revisar después
+            pass
+        else:
+            if afectadas:
+                refrescar_tareas(*afectadas)
+    error = almacenamiento.nuevo_error_escritura()
+    if error is not None:
+        messagebox.showerror("Error", f"No se pudieron guardar los cambios:\n{error}\n"
+                                      "Se vuelve a intentar automáticamente.")
+    programar_revision_cambios()
+
+def programar_revision_cambios():
+    """Programa la próxima revisión de cambios de otras instancias."""
+    global revision_cambios
+    if revision_cambios is not None:
+        ventana.after_cancel(revision_cambios)
+    revision_cambios = ventana.after(INTERVALO_CAMBIOS_EXTERNOS, revisar_cambios_externos)
+
+@medido()
+def cargar_bloque(bloques):
+    """Incorpora el siguiente bloque de tareas y programa el próximo, sin bloquear la ventana."""
+    try:
+        next(bloques)
+    except StopIteration:
+        ventana.title("Organizador de Tareas")
+        boton_agregar_tarea.config(state=tk.NORMAL)
+        boton_vaciar.config(state=tk.NORMAL)
+        boton_importar.config(state=tk.NORMAL)
+        boton_exportar.config(state=tk.NORMAL)
+        boton_archivo.config(state=tk.NORMAL)
+        actualizar_lista_tareas()
+        programar_revision_cambios()
+        return
+    except almacenamiento.ArchivoCorruptoError as error:
+        messagebox.showwarning("Advertencia", f"{error}.\nSe recuperaron solo los cambios posteriores.")
+        ventana.after(0, cargar_bloque, modelo.cargar_por_bloques())
+        return
+    
+    ventana.title(f"Organizador de Tareas (cargando... {len(tareas)} tareas)")
+    ajustar_area_lista()
+    renderizar_filas_visibles(sucias=())
+    actualizar_estadisticas()
+    ventana.after(1, cargar_bloque, bloques)
+
+def alternar_panel_tiempos(evento=None):
+    """Muestra u oculta el panel con el desglose de tiempos del último refresco de la lista."""
+    global panel_tiempos
+    if panel_tiempos is not None:
+        ventana.after_cancel(actualizacion_panel)
+        panel_tiempos.destroy()
+        panel_tiempos = None
+        return
+    panel_tiempos = tk.Label(frame_lista, justify=tk.LEFT, font=("Courier", 9), bg="#ffffe0", relief="solid", bd=1)
+    panel_tiempos.place(relx=1.0, x=-20, y=2, anchor="ne")
+    actualizar_panel_tiempos()
+
+def actualizar_panel_tiempos():
+    """Muestra en el panel el último desglose de tiempos y vuelve a programarse."""
+    global actualizacion_panel
+    desglose = instrumentacion.desglose(REFRESCOS_LISTA)
+    if desglose is None:
+        lineas = ["Sin mediciones todavía"]
+    else:
+        nombre, duracion, internos = desglose
+        lineas = [f"{nombre}: {duracion * 1000:.2f} ms"]
+        lineas += [f"  {interno} x{cantidad}: {total * 1000:.2f} ms" for interno, cantidad, total in internos]
+    panel_tiempos.config(text="\n".join(lineas))
+    actualizacion_panel = ventana.after(500, actualizar_panel_tiempos)
+
+def volcar_traza(evento=None):
+    """Guarda los tiempos medidos en un archivo de traza."""
+    ruta = instrumentacion.ARCHIVO_TRAZA or f"traza-{datetime.now():%Y%m%d-%H%M%S}.json"
+    try:
+        cantidad = instrumentacion.volcar(ruta)
+    except OSError as error:
+        messagebox.showerror("Error", f"No se pudo guardar la traza:\n{error}")
+        return
+    messagebox.showinfo("Traza", f"Se guardaron {cantidad} mediciones en {ruta}.")
+
+def salir():
+    """Cierra la ventana de la aplicación, después de escribir los cambios pendientes."""
+    try:
+        almacenamiento.esperar_escrituras()
+    except OSError as error:
+        if not messagebox.askyesno("Error", f"No se pudieron guardar los cambios:\n{error}\n"
+                                            "¿Salir de todos modos? Se perderán los cambios sin guardar."):
+            return
+    if instrumentacion.ACTIVA and instrumentacion.ARCHIVO_TRAZA:
+        instrumentacion.volcar(instrumentacion.ARCHIVO_TRAZA)
+    ventana.destroy()
+
+def crear_ventana():
+    """Crea la ventana principal con todos sus widgets, todavía sin tareas."""
+    global ventana, frame_lista, canvas_lista, barra_lista, texto_vacio
+    global label_total, label_completadas, label_pendientes, label_porcentaje
+    global label_vencidas, label_categorias, barra_progreso
+    global boton_agregar_tarea, boton_vaciar, boton_importar, boton_exportar, boton_archivo
+    global texto_busqueda
+    global filtro_categoria, filtro_estado, filtro_importantes, filtro_vencidas
+    global filtro_desde, filtro_hasta, entrada_desde, entrada_hasta
+    
+    # Ventana principal
+    ventana = tk.Tk()
+    ventana.title("Organizador de Tareas")
+    ventana.geometry("600x600")
+    ventana.configure(bg="#e6f2ff")
+    ventana.protocol("WM_DELETE_WINDOW", salir)
+
+    # Configurar el grid de la ventana principal
+    ventana.grid_columnconfigure(0, weight=1)
+    ventana.grid_rowconfigure(5, weight=1)
+
+    # Widgets
+    etiqueta_titulo_principal = tk.Label(ventana, text="Organizador de Tareas", font=("Arial", 18), bg="#e6f2ff")
+    etiqueta_titulo_principal.grid(row=0, column=0, pady=10)
+
+    # Frame para estadísticas
+    frame_estadisticas = tk.Frame(ventana, bg="#e6f2ff", relief="solid", bd=1)
+    frame_estadisticas.grid(row=1, column=0, pady=5, padx=10, sticky="ew")
+
+    # Etiquetas para estadísticas
+    label_total = tk.Label(frame_estadisticas, text="Total de Tareas: 0", bg="#e6f2ff")
+    label_total.grid(row=0, column=0, padx=5, pady=2)
+
+    label_completadas = tk.Label(frame_estadisticas, text="Tareas Completadas: 0", bg="#e6f2ff")
+    label_completadas.grid(row=0, column=1, padx=5, pady=2)
+
+    label_pendientes = tk.Label(frame_estadisticas, text="Tareas Pendientes: 0", bg="#e6f2ff")
+    label_pendientes.grid(row=0, column=2, padx=5, pady=2)
+
+    label_porcentaje = tk.Label(frame_estadisticas, text="Porcentaje de Avance: 0%", bg="#e6f2ff")
+    label_porcentaje.grid(row=1, column=0, columnspan=3, padx=5, pady=2)
+
+    # Barra de progreso
+    barra_progreso = ttk.Progressbar(frame_estadisticas, length=300, mode='determinate')
+    barra_progreso.grid(row=2, column=0, columnspan=3, padx=5, pady=5)
+
+    label_vencidas = tk.Label(frame_estadisticas, text="Tareas Vencidas: 0", bg="#e6f2ff", fg="red")
+    label_vencidas.grid(row=3, column=0, padx=5, pady=2)
+
+    label_categorias = tk.Label(frame_estadisticas, text="", bg="#e6f2ff")
+    label_categorias.grid(row=3, column=1, columnspan=2, padx=5, pady=2)
+
+    # Frame para botones superiores
+    frame_botones_superiores = tk.Frame(ventana, bg="#e6f2ff")
+    frame_botones_superiores.grid(row=2, column=0, pady=5)
+
+    boton_agregar_tarea = tk.Button(frame_botones_superiores, text="Agregar Tarea", command=mostrar_formulario_agregar)
+    boton_agregar_tarea.pack(side=tk.LEFT, padx=5)
+
+    boton_vaciar = tk.Button(frame_botones_superiores, text="Vaciar Lista", command=vaciar_lista, fg="red")
+    boton_vaciar.pack(side=tk.LEFT, padx=5)
+
+    boton_importar = tk.Button(frame_botones_superiores, text="Importar", command=importar_archivo)
+    boton_importar.pack(side=tk.LEFT, padx=5)
+
+    boton_exportar = tk.Button(frame_botones_superiores, text="Exportar", command=exportar_archivo)
+    boton_exportar.pack(side=tk.LEFT, padx=5)
+
+    boton_archivo = tk.Button(frame_botones_superiores, text="Archivo", command=mostrar_archivo)
+    boton_archivo.pack(side=tk.LEFT, padx=5)
+
+    # Campo de búsqueda, que filtra la lista mientras se escribe
+    frame_busqueda = tk.Frame(ventana, bg="#e6f2ff")
+    frame_busqueda.grid(row=3, column=0, padx=10, sticky="ew")
+
+    tk.Label(frame_busqueda, text="Buscar:", bg="#e6f2ff").pack(side=tk.LEFT)
+    texto_busqueda = tk.StringVar()
+    entrada_busqueda = tk.Entry(frame_busqueda, textvariable=texto_busqueda)
+    entrada_busqueda.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+    texto_busqueda.trace_add("write", al_escribir_busqueda)
+
+    # Filtros por categoría, estado, importancia y fecha de vencimiento
+    frame_filtros = tk.Frame(ventana, bg="#e6f2ff")
+    frame_filtros.grid(row=4, column=0, padx=10, pady=(5, 0), sticky="ew")
+
+    filtro_categoria = tk.StringVar(value="Todas")
+    ttk.Combobox(frame_filtros, textvariable=filtro_categoria, values=["Todas"] + CATEGORIAS,
+                 state="readonly", width=9).grid(row=0, column=0, padx=2)
+    filtro_estado = tk.StringVar(value="Todas")
+    ttk.Combobox(frame_filtros, textvariable=filtro_estado, values=["Todas", "Pendientes", "Completadas"],
+                 state="readonly", width=11).grid(row=0, column=1, padx=2)
+    filtro_importantes = tk.BooleanVar()
+    tk.Checkbutton(frame_filtros, text="Importantes", variable=filtro_importantes, bg="#e6f2ff").grid(row=0, column=2, padx=2)
+    filtro_vencidas = tk.BooleanVar()
+    tk.Checkbutton(frame_filtros, text="Vencidas", variable=filtro_vencidas, bg="#e6f2ff").grid(row=0, column=3, padx=2)
+
+    tk.Label(frame_filtros, text="Vence desde:", bg="#e6f2ff").grid(row=1, column=0, sticky="e")
+    filtro_desde = tk.StringVar()
+    entrada_desde = tk.Entry(frame_filtros, textvariable=filtro_desde, width=11)
+    entrada_desde.grid(row=1, column=1, sticky="w", padx=2)
+    tk.Label(frame_filtros, text="hasta:", bg="#e6f2ff").grid(row=1, column=2, sticky="e")
+    filtro_hasta = tk.StringVar()
+    entrada_hasta = tk.Entry(frame_filtros, textvariable=filtro_hasta, width=11)
+    entrada_hasta.grid(row=1, column=3, sticky="w", padx=2)
+    tk.Label(frame_filtros, text="(dd/mm/aaaa)", fg="gray", bg="#e6f2ff").grid(row=1, column=4, sticky="w")
+
+    for variable in (filtro_categoria, filtro_estado, filtro_importantes, filtro_vencidas, filtro_desde, filtro_hasta):
+        variable.trace_add("write", al_cambiar_filtros)
+
+    # Frame para contener la lista de tareas
+    frame_lista = tk.Frame(ventana)
+    frame_lista.grid(row=5, column=0, pady=10, padx=10, sticky="nsew")
+    frame_lista.grid_columnconfigure(0, weight=1)
+    frame_lista.grid_rowconfigure(0, weight=1)
+
+    canvas_lista = tk.Canvas(frame_lista, highlightthickness=0, yscrollincrement=ALTO_FILA)
+    canvas_lista.grid(row=0, column=0, sticky="nsew")
+    barra_lista = tk.Scrollbar(frame_lista, orient=tk.VERTICAL, command=canvas_lista.yview)
+    barra_lista.grid(row=0, column=1, sticky="ns")
+    canvas_lista.configure(yscrollcommand=al_desplazar_lista)
+    canvas_lista.bind("<Configure>", al_redimensionar_lista)
+    canvas_lista.bind_class(ETIQUETA_RUEDA, "<MouseWheel>", al_girar_rueda)
+    canvas_lista.bind_class(ETIQUETA_RUEDA, "<Button-4>", al_girar_rueda)
+    canvas_lista.bind_class(ETIQUETA_RUEDA, "<Button-5>", al_girar_rueda)
+    recibir_rueda(canvas_lista)
+
+    texto_vacio = canvas_lista.create_text(10, 20, text="No hay tareas creadas.", fill="gray", anchor="w")
+
+    boton_salir = tk.Button(ventana, text="Salir", command=salir)
+    boton_salir.grid(row=6, column=0, pady=20)
+
+    # Los diálogos quedan construidos y ocultos, para que abrirlos sea inmediato
+    crear_dialogos()
+
+    if instrumentacion.ACTIVA:
+        # F12 muestra el desglose de tiempos; Shift+F12 guarda la traza
+        ventana.bind("<F12>", alternar_panel_tiempos)
+        ventana.bind("<Shift-F12>", volcar_traza)
+
+def iniciar():
+    """Crea la ventana principal, carga las tareas e inicia la aplicación."""
+    crear_ventana()
+
+    # Inicializar la lista de tareas y estadísticas a medida que se cargan,
+    # con la ventana ya visible
+    boton_agregar_tarea.config(state=tk.DISABLED)
+    boton_vaciar.config(state=tk.DISABLED)
+    boton_importar.config(state=tk.DISABLED)
+    boton_exportar.config(state=tk.DISABLED)
+    boton_archivo.config(state=tk.DISABLED)
+    actualizar_lista_tareas()
+    ventana.after(0, cargar_bloque, modelo.cargar_por_bloques())
+
+    # Iniciar aplicación
+    ventana.mainloop()
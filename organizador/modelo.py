@@ -0,0 +1,432 @@
+"""Tareas en memoria, su orden en la lista y las operaciones que las modifican.
+
+El orden, los filtros y las estadísticas se calculan con el día dia_orden, que
+solo avanza en actualizar_vencidas: al cambiar el día se marcan como vencidas
+únicamente las tareas de proximos_vencimientos cuya fecha ya llegó.
+
+Las tareas completadas hace más de DIAS_ARCHIVO días salen de la lista y pasan
+al archivo de tareas archivadas (ver archivar_completadas).
+"""
+
+import bisect
+import heapq
+import os
+import sys
+
+from organizador import almacenamiento, busqueda, estadisticas, filtros
+from organizador.fechas import dia_a_fecha, dia_actual, es_tarea_vencida, fecha_a_dia
+from organizador.instrumentacion import medido
+from organizador.orden import agregar_ordenados
+from organizador.registro import Tarea, desde_dict
+
+# Constantes para categorías
+CATEGORIAS = ["General", "Personal", "Trabajo", "Estudio"]
+
+# Días desde que se completó una tarea hasta que se archiva (0: no se archiva)
+DIAS_ARCHIVO = int(os.environ.get("TAREAS_DIAS_ARCHIVO", "30"))
+
+# Datos de las tareas (organizador.registro.Tarea), indexadas por id
+tareas = {}
+
+# Orden de la lista
+orden_tareas = []  # claves de orden de las tareas, ordenadas
+claves_orden = {}  # id de la tarea -> su clave en orden_tareas
+dia_orden = None  # día con el que se calcularon las claves
+dia_archivo = None  # día en que se archivaron por última vez las tareas completadas
+
+# Vencimientos pendientes: (día, id) de las tareas sin completar que vencen después de
+# dia_orden. Las entradas de tareas que se completaron, eliminaron o cambiaron de fecha
+# no se quitan: se descartan al llegar al frente del heap.
+proximos_vencimientos = []
+
+# Búsqueda y filtros sobre la lista
+consulta = ""  # texto buscado
+criterios = {}  # filtros por atributo (ver organizador.filtros)
+ids_filtrados = None  # ids de las tareas que pasan la búsqueda y los filtros, o None si no se filtra nada
+orden_filtrado = []  # claves de orden de las tareas filtradas, ordenadas
+
+def clave_orden(tarea, hoy):
+    """Devuelve la clave con la que se ordena la tarea en la lista."""
+    dia = tarea.dia
+    return (
+        not tarea.importante,                       # Importantes primero
+        not es_tarea_vencida(tarea, hoy),           # Vencidas después
+        sys.maxsize if dia is None else dia,        # Por fecha, las que no tienen al final
+        tarea.id
+    )
+
+def programar_vencimiento(tarea):
+    """Agrega la tarea a los vencimientos pendientes si todavía no venció."""
+    dia = tarea.dia
+    if dia is not None and dia > dia_orden and not tarea.completada:
+        heapq.heappush(proximos_vencimientos, (dia, tarea.id))
+
+def reconstruir_vencimientos():
+    """Vuelve a armar los vencimientos pendientes, sin entradas descartadas."""
+    proximos_vencimientos[:] = [
+        (tarea.dia, tarea.id) for tarea in tareas.values()
+        if tarea.dia is not None and tarea.dia > dia_orden and not tarea.completada
+    ]
+    heapq.heapify(proximos_vencimientos)
+
+def _vencimiento_vigente(dia, id_tarea):
+    """Indica si una entrada de los vencimientos pendientes sigue correspondiendo a su tarea."""
+    tarea = tareas.get(id_tarea)
+    return tarea is not None and tarea.dia == dia and not tarea.completada
+
+def proximo_vencimiento():
+    """Devuelve el día del próximo vencimiento pendiente, o None si no hay ninguno."""
+    while proximos_vencimientos and not _vencimiento_vigente(*proximos_vencimientos[0]):
+        heapq.heappop(proximos_vencimientos)
+    return proximos_vencimientos[0][0] if proximos_vencimientos else None
+
+@medido()
+def actualizar_vencidas():
+    """Lleva el orden y las estadísticas al día actual y devuelve los ids de las tareas que vencieron.
+
+    Solo se reubican y se cuentan las tareas cuya fecha llegó desde el día anterior;
+    las demás no cambian. Si el reloj retrocedió se recalcula todo y se devuelve None.
+    """
+    global dia_orden
+    hoy = dia_actual()
+    if hoy == dia_orden:
+        return []
+    if dia_orden is None or hoy < dia_orden:
+        ordenar_tareas()
+        estadisticas.recontar_estadisticas(tareas)
+        return None
+    anterior = dia_orden
+    dia_orden = hoy
+    vencidas = []
+    while proximos_vencimientos and proximos_vencimientos[0][0] <= hoy:
+        dia, id_tarea = heapq.heappop(proximos_vencimientos)
+        if _vencimiento_vigente(dia, id_tarea):
+            vencidas.append(id_tarea)
+    # Una tarea puede estar repetida si volvió a la misma fecha
+    vencidas = list(dict.fromkeys(vencidas))
+    reubicar_tareas(vencidas)
+    estadisticas.avanzar_dia(len(vencidas), anterior, hoy, tareas)
+    return vencidas
+
+@medido()
+def ordenar_tareas():
+    """Recalcula desde cero el orden de la lista con las claves del día actual."""
+    global orden_tareas, dia_orden
+    dia_orden = dia_actual()
+    claves_orden.clear()
+    for tarea in tareas.values():
+        claves_orden[tarea.id] = clave_orden(tarea, dia_orden)
+    reconstruir_vencimientos()
+    
+    # Ordenar tareas: primero las importantes, luego las vencidas, luego el resto.
+    # Se ordena siempre con las claves en memoria, también con SQLite: la lista se
+    # mantiene después con bisect, así que tiene que estar en el orden exacto de clave_orden
+    orden_tareas = sorted(claves_orden.values())
+    # Con el día pueden cambiar las tareas vencidas, así que se vuelve a filtrar
+    aplicar_filtros()
+
+def ordenar_filtradas():
+    """Recalcula el orden de las tareas que pasan la búsqueda y los filtros."""
+    global orden_filtrado
+    if ids_filtrados is None:
+        orden_filtrado = []
+    elif len(ids_filtrados) * 8 < len(orden_tareas):
+        # Pocas coincidencias: es más rápido ordenar solo sus claves
+        orden_filtrado = sorted(claves_orden[id_tarea] for id_tarea in ids_filtrados)
+    else:
+        orden_filtrado = [clave for clave in orden_tareas if clave[-1] in ids_filtrados]
+
+@medido()
+def aplicar_filtros(candidatas=None):
+    """Calcula las tareas que pasan la búsqueda y los filtros, intersecando sus índices."""
+    global ids_filtrados
+    encontradas = busqueda.buscar(consulta, candidatas)
+    filtradas = filtros.filtrar(criterios, dia_orden)
+    if encontradas is None or filtradas is None:
+        ids_filtrados = filtradas if encontradas is None else encontradas
+    else:
+        ids_filtrados = encontradas & filtradas
+    ordenar_filtradas()
+
+def coincide_con_filtros(tarea):
+    """Indica si una tarea pasa la búsqueda y los filtros."""
+    return busqueda.coincide(tarea.id, consulta) and filtros.coincide(tarea, criterios, dia_orden)
+
+def buscar_tareas(texto):
+    """Filtra la lista para mostrar solo las tareas que contienen el texto buscado."""
+    global consulta
+    # Si se sigue escribiendo, alcanza con buscar entre las tareas que ya coincidían
+    candidatas = ids_filtrados if busqueda.refina(texto, consulta) else None
+    consulta = texto
+    aplicar_filtros(candidatas)
+
+def filtrar_tareas(nuevos_criterios):
+    """Filtra la lista para mostrar solo las tareas que cumplen los criterios indicados."""
+    criterios.clear()
+    criterios.update(nuevos_criterios)
+    aplicar_filtros()
+
+@medido()
+def reubicar_tareas(ids):
+    """Quita y vuelve a insertar en el orden de la lista solo las tareas indicadas."""
+    if len(ids) > 100 and len(ids) * 200 >= len(orden_tareas):
+        reordenar_tareas(ids)
+        return
+    filtrando = ids_filtrados is not None
+    for id_tarea in ids:
+        clave = claves_orden.pop(id_tarea, None)
+        if clave is not None:
+            del orden_tareas[bisect.bisect_left(orden_tareas, clave)]
+            if filtrando and id_tarea in ids_filtrados:
+                ids_filtrados.discard(id_tarea)
+                del orden_filtrado[bisect.bisect_left(orden_filtrado, clave)]
+        if id_tarea in tareas:
+            clave = clave_orden(tareas[id_tarea], dia_orden)
+            claves_orden[id_tarea] = clave
+            bisect.insort(orden_tareas, clave)
+            programar_vencimiento(tareas[id_tarea])
+            # Al editarla, la tarea puede empezar o dejar de pasar los filtros
+            if filtrando and coincide_con_filtros(tareas[id_tarea]):
+                ids_filtrados.add(id_tarea)
+                bisect.insort(orden_filtrado, clave)
+    if len(proximos_vencimientos) > 2 * len(tareas) + 1000:
+        # Demasiadas entradas descartadas acumuladas
+        reconstruir_vencimientos()
+
+def reordenar_tareas(ids):
+    """Como reubicar_tareas, pero para muchas tareas: reemplaza sus claves y vuelve a ordenar la lista."""
+    global orden_tareas
+    quitadas = set()
+    for id_tarea in ids:
+        clave = claves_orden.pop(id_tarea, None)
+        if clave is not None:
+            quitadas.add(clave)
+        if id_tarea in tareas:
+            claves_orden[id_tarea] = clave_orden(tareas[id_tarea], dia_orden)
+            programar_vencimiento(tareas[id_tarea])
+    orden_tareas = [clave for clave in orden_tareas if clave not in quitadas]
+    agregar_ordenados(orden_tareas, [claves_orden[id_tarea] for id_tarea in ids if id_tarea in tareas])
+    aplicar_filtros()
+    if len(proximos_vencimientos) > 2 * len(tareas) + 1000:
+        reconstruir_vencimientos()
+
+def tareas_en_orden(inicio, fin):
+    """Devuelve las tareas que ocupan las posiciones [inicio, fin) de la lista."""
+    orden = orden_tareas if ids_filtrados is None else orden_filtrado
+    return [tareas[clave[-1]] for clave in orden[inicio:fin]]
+
+def cantidad_en_lista():
+    """Devuelve cuántas tareas se muestran en la lista."""
+    return len(orden_tareas if ids_filtrados is None else orden_filtrado)
+
+def cargar_por_bloques(tam_bloque=None):
+    """Carga las tareas de a bloques, manteniendo el orden y las estadísticas al día.
+
+    Es un generador: después de incorporar cada bloque devuelve sus tareas, para
+    que la interfaz pueda mostrarlas mientras sigue la carga. Al terminar se
+    archivan las tareas completadas hace tiempo.
+    """
+    global dia_orden, dia_archivo
+    tareas.clear()
+    claves_orden.clear()
+    del orden_tareas[:]
+    del proximos_vencimientos[:]
+    busqueda.vaciar_indice()
+    filtros.vaciar_indices()
+    dia_orden = dia_actual()
+    dia_archivo = None
+    estadisticas.reiniciar_estadisticas()
+    aplicar_filtros()
+    for bloque in almacenamiento.cargar_tareas_por_bloques(tam_bloque):
+        bloque = [desde_dict(datos) for datos in bloque]
+        for tarea in bloque:
+            tareas[tarea.id] = tarea
+            claves_orden[tarea.id] = clave_orden(tarea, dia_orden)
+            programar_vencimiento(tarea)
+            estadisticas.contar_tarea(tarea, 1)
+        busqueda.indexar_tareas(bloque)
+        filtros.indexar_tareas(bloque)
+        agregar_ordenados(orden_tareas, [claves_orden[tarea.id] for tarea in bloque])
+        if ids_filtrados is not None:
+            aplicar_filtros()
+        yield bloque
+    almacenamiento.guardar_ids_asignados(tareas)
+    archivar_completadas()
+
+def cargar():
+    """Carga todas las tareas del almacenamiento y calcula su orden y estadísticas."""
+    for _ in cargar_por_bloques():
+        pass
+
+def agregar_tarea(titulo, descripcion, categoria, fecha):
+    """Crea una tarea nueva y la devuelve."""
+    tarea = Tarea(almacenamiento.nuevo_id(), titulo, descripcion, False, categoria, fecha, False)
+    tareas[tarea.id] = tarea
+    estadisticas.contar_tarea(tarea, 1)
+    busqueda.indexar_tareas([tarea])
+    filtros.indexar_tareas([tarea])
+    almacenamiento.registrar_operacion(tareas, {"op": "agregar", "tarea": tarea})
+    reubicar_tareas([tarea.id])
+    return tarea
+
+@medido()
+def agregar_tareas(nuevas):
+    """Agrega muchas tareas de una vez, con una sola escritura en el almacenamiento.
+
+    Recibe las tareas en el formato JSON, les asigna un id nuevo y devuelve las
+    tareas agregadas.
+    """
+    nuevas = [desde_dict(datos) for datos in nuevas]
+    for tarea in nuevas:
+        tarea.id = almacenamiento.nuevo_id()
+        tareas[tarea.id] = tarea
+        estadisticas.contar_tarea(tarea, 1)
+    busqueda.indexar_tareas(nuevas)
+    filtros.indexar_tareas(nuevas)
+    almacenamiento.registrar_tareas_nuevas(tareas, nuevas)
+    for tarea in nuevas:
+        claves_orden[tarea.id] = clave_orden(tarea, dia_orden)
+        programar_vencimiento(tarea)
+    agregar_ordenados(orden_tareas, [claves_orden[tarea.id] for tarea in nuevas])
+    if ids_filtrados is not None:
+        aplicar_filtros()
+    return nuevas
+
+@medido()
+def incorporar_cambios_externos():
+    """Incorpora los cambios que otra instancia guardó y devuelve los ids de las tareas afectadas.
+
+    Solo se reemplazan, agregan o quitan las tareas que cambiaron; las demás no se tocan.
+    """
+    cambios = almacenamiento.leer_cambios_externos(tareas)
+    if not cambios:
+        return []
+    for id_tarea, datos in cambios.items():
+        anterior = tareas.pop(id_tarea, None)
+        if anterior is not None:
+            estadisticas.contar_tarea(anterior, -1)
+        if datos is None:
+            busqueda.desindexar_tarea(id_tarea)
+            filtros.desindexar_tarea(id_tarea)
+        else:
+            tareas[id_tarea] = desde_dict(datos)
+            estadisticas.contar_tarea(tareas[id_tarea], 1)
+    presentes = [tareas[id_tarea] for id_tarea in cambios if id_tarea in tareas]
+    busqueda.indexar_tareas(presentes)
+    filtros.indexar_tareas(presentes)
+    reubicar_tareas(list(cambios))
+    return list(cambios)
+
+def actualizar_tarea(id_tarea, cambios):
+    """Modifica los campos indicados de una tarea."""
+    tarea = tareas[id_tarea]
+    estadisticas.contar_tarea(tarea, -1)
+    tarea.update(cambios)
+    estadisticas.contar_tarea(tarea, 1)
+    if 'titulo' in cambios or 'descripcion' in cambios:
+        busqueda.indexar_tareas([tarea])
+    filtros.indexar_tareas([tarea])
+    almacenamiento.registrar_operacion(tareas, {"op": "actualizar", "id": id_tarea, "campos": cambios})
+    reubicar_tareas([id_tarea])
+
+def alternar_completada(id_tarea):
+    """Alterna el estado de completada de una tarea, anotando el día en que se completó."""
+    if tareas[id_tarea].completada:
+        actualizar_tarea(id_tarea, {'completada': False})
+    else:
+        actualizar_tarea(id_tarea, {'completada': True, 'completada_en': dia_a_fecha(dia_actual())})
+
+def alternar_importante(id_tarea):
+    """Alterna el estado de importante de una tarea."""
+    actualizar_tarea(id_tarea, {'importante': not tareas[id_tarea].importante})
+
+def eliminar_tarea(id_tarea):
+    """Elimina una tarea."""
+    estadisticas.contar_tarea(tareas.pop(id_tarea), -1)
+    busqueda.desindexar_tarea(id_tarea)
+    filtros.desindexar_tarea(id_tarea)
+    almacenamiento.registrar_operacion(tareas, {"op": "eliminar", "id": id_tarea})
+    reubicar_tareas([id_tarea])
+
+def _quitar_tareas(ids):
+    """Quita de la lista, los índices y las estadísticas las tareas indicadas."""
+    for id_tarea in ids:
+        estadisticas.contar_tarea(tareas.pop(id_tarea), -1)
+        busqueda.desindexar_tarea(id_tarea)
+        filtros.desindexar_tarea(id_tarea)
+    almacenamiento.registrar_operaciones(tareas, [{"op": "eliminar", "id": id_tarea} for id_tarea in ids])
+    reubicar_tareas(ids)
+
+@medido()
+def archivar_completadas():
+    """Pasa al archivo las tareas completadas hace más de DIAS_ARCHIVO días y devuelve sus ids.
+
+    Se hace una vez por día. Las tareas completadas antes de que se anotara el
+    día en que se completaron toman el día de hoy, y se archivan cuando pasen
+    DIAS_ARCHIVO días.
+    """
+    global dia_archivo
+    if DIAS_ARCHIVO <= 0 or dia_archivo == dia_orden:
+        return []
+    dia_archivo = dia_orden
+    limite = dia_orden - DIAS_ARCHIVO
+    sin_dia = []
+    viejas = []
+    dias = {}  # muchas tareas se completan el mismo día: cada fecha se convierte una vez
+    for id_tarea in filtros.por_estado[True]:
+        fecha = tareas[id_tarea].get('completada_en')
+        dia = dias.get(fecha)
+        if dia is None and fecha not in dias:
+            dia = dias[fecha] = fecha_a_dia(fecha) if isinstance(fecha, str) else None
+        if dia is None:
+            sin_dia.append(id_tarea)
+        elif dia <= limite:
+            viejas.append(id_tarea)
+    if sin_dia:
+        hoy = dia_a_fecha(dia_orden)
+        for id_tarea in sin_dia:
+            tareas[id_tarea]['completada_en'] = hoy
+        almacenamiento.registrar_operaciones(tareas, [
+            {"op": "actualizar", "id": id_tarea, "campos": {'completada_en': hoy}} for id_tarea in sin_dia
+        ])
+    if viejas:
+        # Primero se escribe el archivo, para que una falla no pierda las tareas
+        almacenamiento.archivar_tareas([tareas[id_tarea] for id_tarea in viejas])
+        _quitar_tareas(viejas)
+    return viejas
+
+def tareas_archivadas():
+    """Lee del archivo las tareas archivadas que no están en la lista, de la más reciente a la más vieja."""
+    archivadas = [tarea for id_tarea, tarea in almacenamiento.leer_archivadas().items() if id_tarea not in tareas]
+    archivadas.sort(key=lambda tarea: fecha_a_dia(tarea.get('completada_en')) or 0, reverse=True)
+    return archivadas
+
+def restaurar_tarea(datos):
+    """Devuelve a la lista, como pendiente, una tarea archivada (en el formato JSON) y la devuelve."""
+    tarea = desde_dict(datos)
+    tarea['completada'] = False
+    if not isinstance(tarea.id, int) or tarea.id in tareas:
+        tarea.id = almacenamiento.nuevo_id()
+    tareas[tarea.id] = tarea
+    estadisticas.contar_tarea(tarea, 1)
+    busqueda.indexar_tareas([tarea])
+    filtros.indexar_tareas([tarea])
+    almacenamiento.registrar_operacion(tareas, {"op": "agregar", "tarea": tarea})
+    reubicar_tareas([tarea.id])
+    # La tarea tiene que estar en la lista guardada antes de sacarla del archivo
+    almacenamiento.esperar_escrituras()
+    almacenamiento.marcar_restaurada(datos["id"])
+    return tarea
+
+def vaciar_tareas():
+    """Elimina todas las tareas.
+
+    Se registra como una operación más, en lugar de guardar un snapshot vacío que
+    pisaría los cambios de otra instancia que todavía no se leyeron.
+    """
+    tareas.clear()
+    busqueda.vaciar_indice()
+    filtros.vaciar_indices()
+    almacenamiento.registrar_operacion(tareas, {"op": "vaciar"})
+    ordenar_tareas()
+    estadisticas.recontar_estadisticas(tareas)
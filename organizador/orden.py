@@ -0,0 +1,11 @@
+"""Listas que se mantienen ordenadas al agregarles elementos de a muchos."""
+
+def agregar_ordenados(lista, nuevos):
+    """Agrega los elementos nuevos a una lista ordenada, dejándola ordenada.
+
+    Los elementos que ya estaban forman una corrida ordenada, que el sort de
+    Python reconoce: ordenar cuesta casi lo mismo que mezclar los nuevos, en
+    lugar de insertarlos de a uno con bisect.
+    """
+    lista.extend(nuevos)
+    lista.sort()
@@ -0,0 +1,239 @@
+"""Representación compacta de las tareas en memoria.
+
+Tarea guarda cada tarea en __slots__: la categoría como código entero, el
+vencimiento como número de día y completada/importante como bits de un solo
+entero. Se usa como el dict del formato JSON (tarea['titulo'], tarea.get(...),
+tarea.update(...), dict(tarea)) y se convierte sin pérdidas desde y hacia él:
+los campos que faltaban siguen faltando y los valores que no entran en la forma
+compacta (fechas con otro formato, campos desconocidos) se guardan tal cual.
+"""
+
+from datetime import date
+
+from organizador.fechas import fecha_a_dia
+
+# Campos del formato JSON, en el orden en que se escriben
+CAMPOS = ("id", "titulo", "descripcion", "completada", "categoria", "fecha_vencimiento", "importante")
+_CAMPOS = frozenset(CAMPOS)
+
+# Categorías internadas: cada nombre se guarda una sola vez y las tareas guardan su código
+_CATEGORIAS = []
+_CODIGOS_CATEGORIA = {}
+
+# Bits de _banderas
+_COMPLETADA = 1
+_IMPORTANTE = 2
+# Campos que faltaban en el dict de origen
+_AUSENCIAS = {"titulo": 4, "descripcion": 8, "completada": 16, "categoria": 32, "importante": 64}
+_SIN_FECHA = object()  # valor de _fecha cuando faltaba fecha_vencimiento
+_FECHA_DEL_DIA = object()  # valor de _fecha cuando la fecha es "dd/mm/aaaa" y sale de _dia
+
+def codigo_categoria(categoria):
+    """Devuelve el código de una categoría, asignándole uno nuevo si es la primera vez."""
+    codigo = _CODIGOS_CATEGORIA.get(categoria)
+    if codigo is None:
+        codigo = _CODIGOS_CATEGORIA[categoria] = len(_CATEGORIAS)
+        _CATEGORIAS.append(categoria)
+    return codigo
+
+def _leer_fecha(fecha):
+    """Devuelve (día, valor para _fecha) de una fecha de vencimiento."""
+    if (isinstance(fecha, str) and len(fecha) == 10 and fecha[2] == "/" and fecha[5] == "/"
+            and fecha[:2].isdigit() and fecha[3:5].isdigit() and fecha[6:].isdigit()):
+        try:
+            return date(int(fecha[6:]), int(fecha[3:5]), int(fecha[:2])).toordinal(), _FECHA_DEL_DIA
+        except ValueError:
+            return None, fecha
+    # Cualquier otro valor se conserva como vino
+    return fecha_a_dia(fecha), fecha
+
+class Tarea:
+    """Una tarea en memoria, con sus campos en forma compacta."""
+
+    __slots__ = ("id", "titulo", "descripcion", "_categoria", "_dia", "_fecha", "_banderas", "_extra")
+
+    def __init__(self, id_tarea, titulo, descripcion="", completada=False, categoria="General",
+                 fecha_vencimiento="", importante=False):
+        self.id = id_tarea
+        self.titulo = titulo
+        self.descripcion = descripcion
+        self._banderas = 0
+        self._extra = None  # campos desconocidos y valores que no entran en la forma compacta
+        self.completada = completada
+        self.categoria = categoria
+        self.fecha_vencimiento = fecha_vencimiento
+        self.importante = importante
+
+    def _guardar_aparte(self, campo, valor):
+        """Guarda tal cual el valor de un campo que no entra en la forma compacta."""
+        if self._extra is None:
+            self._extra = {}
+        self._extra[campo] = valor
+
+    def _quitar_aparte(self, campo):
+        """Descarta el valor guardado tal cual de un campo, si había uno."""
+        if self._extra is not None:
+            self._extra.pop(campo, None)
+            if not self._extra:
+                self._extra = None
+
+    def _bandera(self, bit, valor, campo):
+        """Guarda un campo booleano como bit; los valores que no son bool se guardan aparte."""
+        if valor is True or valor is False:
+            self._quitar_aparte(campo)
+        else:
+            self._guardar_aparte(campo, valor)
+        self._banderas = self._banderas | bit if valor else self._banderas & ~bit
+
+    @property
+    def completada(self):
+        return bool(self._banderas & _COMPLETADA)
+
+    @completada.setter
+    def completada(self, valor):
+        self._bandera(_COMPLETADA, valor, "completada")
+
+    @property
+    def importante(self):
+        return bool(self._banderas & _IMPORTANTE)
+
+    @importante.setter
+    def importante(self, valor):
+        self._bandera(_IMPORTANTE, valor, "importante")
+
+    @property
+    def categoria(self):
+        if self._extra is not None and "categoria" in self._extra:
+            return self._extra["categoria"]
+        return _CATEGORIAS[self._categoria]
+
+    @categoria.setter
+    def categoria(self, valor):
+        if isinstance(valor, str):
+            self._quitar_aparte("categoria")
+            self._categoria = codigo_categoria(valor)
+        else:
+            self._guardar_aparte("categoria", valor)
+            self._categoria = codigo_categoria("General")
+
+    @property
+    def dia(self):
+        """Día de vencimiento, o None si la tarea no tiene una fecha válida."""
+        return self._dia
+
+    @property
+    def fecha_vencimiento(self):
+        if self._fecha is _FECHA_DEL_DIA:
+            dia = date.fromordinal(self._dia)
+            return f"{dia.day:02d}/{dia.month:02d}/{dia.year:04d}"
+        return "" if self._fecha is _SIN_FECHA else self._fecha
+
+    @fecha_vencimiento.setter
+    def fecha_vencimiento(self, valor):
+        self._dia, self._fecha = _leer_fecha(valor)
+
+    # Acceso como dict, con los mismos campos que el formato JSON
+
+    def _tiene(self, campo):
+        if campo == "fecha_vencimiento":
+            return self._fecha is not _SIN_FECHA
+        return campo == "id" or not self._banderas & _AUSENCIAS[campo]
+
+    def __getitem__(self, campo):
+        if campo in _CAMPOS:
+            if self._tiene(campo):
+                if self._extra is not None and campo in self._extra:
+                    return self._extra[campo]
+                return getattr(self, campo)
+        elif self._extra is not None and campo in self._extra:
+            return self._extra[campo]
+        raise KeyError(campo)
+
+    def __setitem__(self, campo, valor):
+        if campo in _CAMPOS:
+            setattr(self, campo, valor)
+            self._banderas &= ~_AUSENCIAS.get(campo, 0)
+        else:
+            self._guardar_aparte(campo, valor)
+
+    def __contains__(self, campo):
+        if campo in _CAMPOS:
+            return self._tiene(campo)
+        return self._extra is not None and campo in self._extra
+
+    def get(self, campo, defecto=None):
+        try:
+            return self[campo]
+        except KeyError:
+            return defecto
+
+    def keys(self):
+        campos = [campo for campo in CAMPOS if self._tiene(campo)]
+        if self._extra is not None:
+            campos += [campo for campo in self._extra if campo not in _CAMPOS]
+        return campos
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def items(self):
+        return [(campo, self[campo]) for campo in self.keys()]
+
+    def update(self, cambios):
+        for campo, valor in cambios.items():
+            self[campo] = valor
+
+    def copy(self):
+        """Devuelve una copia independiente de la tarea."""
+        copia = Tarea.__new__(Tarea)
+        copia.id = self.id
+        copia.titulo = self.titulo
+        copia.descripcion = self.descripcion
+        copia._categoria = self._categoria
+        copia._dia = self._dia
+        copia._fecha = self._fecha
+        copia._banderas = self._banderas
+        copia._extra = None if self._extra is None else dict(self._extra)
+        return copia
+
+    def __repr__(self):
+        return f"Tarea({a_dict(self)!r})"
+
+def desde_dict(datos):
+    """Convierte una tarea del formato JSON en una Tarea."""
+    tarea = Tarea(datos.get("id"), datos.get("titulo", ""), datos.get("descripcion", ""),
+                  datos.get("completada", False), datos.get("categoria", "General"),
+                  datos.get("fecha_vencimiento", ""), datos.get("importante", False))
+    if len(datos) != len(CAMPOS) or not _CAMPOS.issuperset(datos):
+        # Recordar los campos que faltaban y guardar aparte los desconocidos
+        for campo, bit in _AUSENCIAS.items():
+            if campo not in datos:
+                tarea._banderas |= bit
+        if "fecha_vencimiento" not in datos:
+            tarea._fecha = _SIN_FECHA
+        for campo, valor in datos.items():
+            if campo not in _CAMPOS:
+                tarea._guardar_aparte(campo, valor)
+    return tarea
+
+def a_dict(tarea):
+    """Convierte una Tarea en el dict del formato JSON (sirve como default de json.dumps)."""
+    if isinstance(tarea, dict):
+        return tarea
+    if not isinstance(tarea, Tarea):
+        raise TypeError(f"No se puede convertir a JSON: {tarea!r}")
+    if tarea._extra is None and not tarea._banderas & ~(_COMPLETADA | _IMPORTANTE) and tarea._fecha is not _SIN_FECHA:
+        # Caso común: todos los campos presentes y en forma compacta
+        return {
+            "id": tarea.id,
+            "titulo": tarea.titulo,
+            "descripcion": tarea.descripcion,
+            "completada": tarea.completada,
+            "categoria": _CATEGORIAS[tarea._categoria],
+            "fecha_vencimiento": tarea.fecha_vencimiento,
+            "importante": tarea.importante
+        }
+    return {campo: tarea[campo] for campo in tarea.keys()}
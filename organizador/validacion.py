@@ -0,0 +1,85 @@
+"""Validación del título, la descripción y demás campos de las tareas.
+
+Los problemas se devuelven como ErrorValidacion en lugar de mostrarse, para
+poder validar muchas tareas de una vez y que la interfaz decida qué mostrar.
+"""
+
+import re
+from collections import namedtuple
+
+from organizador.fechas import fecha_a_dia
+from organizador.modelo import CATEGORIAS
+
+MAX_TITULO = 50
+MAX_DESCRIPCION = 200
+
+# Caracteres que no pueden aparecer en el título ni en la descripción
+_PROHIBIDOS = re.compile(r'[<>\[\]{}|\\@#$%^&*~+=`]')
+
+# Un problema de validación: campo de la tarea, código del problema y mensaje para el usuario
+ErrorValidacion = namedtuple("ErrorValidacion", ["campo", "codigo", "mensaje"])
+
+def validar_caracteres(texto, campo="titulo"):
+    """Valida que el texto no contenga caracteres prohibidos.
+
+    Devuelve un ErrorValidacion con los caracteres prohibidos, o None si el texto es válido.
+    """
+    prohibidos = _PROHIBIDOS.findall(texto)
+    if prohibidos:
+        return ErrorValidacion(campo, "caracteres", f"Caracteres no permitidos: {' '.join(dict.fromkeys(prohibidos))}")
+    return None
+
+def validar_tarea(titulo, descripcion=""):
+    """Valida el título y la descripción de la tarea.
+
+    Devuelve la lista de problemas encontrados, vacía si la tarea es válida.
+    """
+    errores = []
+    titulo = titulo.strip()
+
+    if not titulo:
+        errores.append(ErrorValidacion("titulo", "obligatorio", "El título es obligatorio."))
+    elif len(titulo) > MAX_TITULO:
+        errores.append(ErrorValidacion("titulo", "largo", f"Máximo {MAX_TITULO} caracteres para el título."))
+    error = validar_caracteres(titulo, "titulo")
+    if error:
+        errores.append(error)
+    if descripcion:
+        error = validar_caracteres(descripcion, "descripcion")
+        if error:
+            errores.append(error)
+    if len(descripcion) > MAX_DESCRIPCION:
+        errores.append(ErrorValidacion("descripcion", "largo", f"Máximo {MAX_DESCRIPCION} caracteres para la descripción."))
+    return errores
+
+def validar_registro(tarea):
+    """Valida todos los campos de una tarea guardada como dict.
+
+    Devuelve la lista de problemas encontrados, vacía si la tarea es válida.
+    """
+    titulo = tarea.get('titulo')
+    descripcion = tarea.get('descripcion') or ""
+    if not isinstance(titulo, str):
+        return [ErrorValidacion("titulo", "tipo", "El título debe ser texto.")]
+    if not isinstance(descripcion, str):
+        return [ErrorValidacion("descripcion", "tipo", "La descripción debe ser texto.")]
+    errores = validar_tarea(titulo, descripcion)
+    categoria = tarea.get('categoria', 'General')
+    if categoria not in CATEGORIAS:
+        errores.append(ErrorValidacion("categoria", "desconocida", f"Categoría desconocida: {categoria}"))
+    fecha = tarea.get('fecha_vencimiento')
+    if fecha and fecha_a_dia(fecha) is None:
+        errores.append(ErrorValidacion("fecha_vencimiento", "formato", f"Fecha inválida (se espera dd/mm/aaaa): {fecha}"))
+    return errores
+
+def validar_tareas(lista_tareas):
+    """Valida muchas tareas de una vez.
+
+    Devuelve una lista de (posición, errores) solo con las tareas que tienen problemas.
+    """
+    invalidas = []
+    for posicion, tarea in enumerate(lista_tareas):
+        errores = validar_registro(tarea)
+        if errores:
+            invalidas.append((posicion, errores))
+    return invalidas
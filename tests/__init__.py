@@ -0,0 +1 @@
+"""Pruebas del organizador de tareas (python -m unittest o python -m pytest)."""
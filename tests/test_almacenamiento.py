@@ -0,0 +1,184 @@
+"""Pruebas del snapshot JSON con journal: recarga, compactación y cambios de otra instancia."""
+
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from organizador import almacenamiento, modelo
+from organizador.registro import a_dict
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def tareas_guardadas():
+    """Lee las tareas del disco, como las vería una instancia nueva, en el formato JSON."""
+    return {id_tarea: a_dict(tarea) for id_tarea, tarea in almacenamiento.cargar_tareas().items()}
+
+def tareas_en_memoria():
+    """Devuelve las tareas del modelo en el formato JSON."""
+    return {id_tarea: a_dict(tarea) for id_tarea, tarea in modelo.tareas.items()}
+
+class JournalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio_anterior = os.getcwd()
+        self.directorio = tempfile.TemporaryDirectory()
+        os.chdir(self.directorio.name)
+        parche = mock.patch.object(almacenamiento, "ALMACENAMIENTO", "json")
+        parche.start()
+        self.addCleanup(parche.stop)
+        modelo.cargar()
+
+    def tearDown(self):
+        almacenamiento.esperar_escrituras()
+        os.chdir(self.directorio_anterior)
+        self.directorio.cleanup()
+
+    def otra_instancia(self, codigo):
+        """Ejecuta código en otro proceso, con el modelo cargado desde el mismo directorio."""
+        entorno = dict(os.environ, PYTHONPATH=RAIZ, TAREAS_ALMACENAMIENTO="json")
+        programa = ("from organizador import almacenamiento, modelo\n"
+                    "modelo.cargar()\n"
+                    f"{codigo}\n"
+                    "almacenamiento.esperar_escrituras()\n")
+        subprocess.run([sys.executable, "-c", programa], check=True, env=entorno)
+
+    def test_recarga_snapshot_y_journal(self):
+        modelo.agregar_tarea("Base", "", "General", "")
+        almacenamiento.guardar_tareas(modelo.tareas)
+        uno = modelo.agregar_tarea("Uno", "", "Trabajo", "05/01/2026")
+        dos = modelo.agregar_tarea("Dos", "", "Personal", "")
+        modelo.actualizar_tarea(uno.id, {'titulo': "Uno editada", 'importante': True})
+        modelo.eliminar_tarea(dos.id)
+        almacenamiento.esperar_escrituras()
+        self.assertTrue(os.path.exists(almacenamiento.ARCHIVO_JOURNAL))
+
+        esperadas = tareas_en_memoria()
+        modelo.cargar()
+        self.assertEqual(tareas_en_memoria(), esperadas)
+        self.assertEqual(modelo.tareas[uno.id].titulo, "Uno editada")
+
+    def test_compacta_al_llegar_al_umbral(self):
+        with mock.patch.object(almacenamiento, "UMBRAL_COMPACTACION", 5):
+            for numero in range(5):
+                modelo.agregar_tarea(f"Tarea {numero}", "", "General", "")
+            almacenamiento.esperar_escrituras()
+
+        with open(almacenamiento.ARCHIVO_TAREAS) as f:
+            self.assertEqual(len(json.load(f)), 5)
+        # El journal se rotó y el segmento se eliminó al quedar incluido en el snapshot
+        self.assertEqual(glob.glob(almacenamiento.ARCHIVO_JOURNAL + "*"), [])
+        self.assertEqual(tareas_guardadas(), tareas_en_memoria())
+
+    def test_no_compacta_con_cambios_de_otra_instancia_sin_leer(self):
+        self.otra_instancia('modelo.agregar_tarea("De la otra", "", "General", "")')
+        with mock.patch.object(almacenamiento, "UMBRAL_COMPACTACION", 3):
+            modelo.agregar_tareas([{"titulo": f"Nueva {numero}"} for numero in range(3)])
+            almacenamiento.esperar_escrituras()
+
+        # Un snapshot con solo las tareas de esta instancia perdería la de la otra
+        self.assertFalse(os.path.exists(almacenamiento.ARCHIVO_TAREAS))
+        titulos = sorted(tarea["titulo"] for tarea in tareas_guardadas().values())
+        self.assertEqual(titulos, ["De la otra", "Nueva 0", "Nueva 1", "Nueva 2"])
+
+    def test_descarta_la_ultima_linea_incompleta_del_journal(self):
+        modelo.agregar_tarea("Uno", "", "General", "")
+        modelo.agregar_tarea("Dos", "", "General", "")
+        almacenamiento.esperar_escrituras()
+        esperadas = tareas_en_memoria()
+        # Escritura interrumpida a mitad de una línea
+        with open(almacenamiento.ARCHIVO_JOURNAL, "a") as f:
+            f.write('{"op": "agregar", "tarea": {"id": 900, "tit')
+
+        modelo.cargar()
+        self.assertEqual(tareas_en_memoria(), esperadas)
+
+        # Lo que se escribe después de la línea incompleta no se pierde
+        tres = modelo.agregar_tarea("Tres", "", "General", "")
+        almacenamiento.esperar_escrituras()
+        self.assertIn(tres.id, tareas_guardadas())
+
+    def test_lee_el_journal_de_otra_instancia(self):
+        uno = modelo.agregar_tarea("Uno", "", "General", "")
+        dos = modelo.agregar_tarea("Dos", "", "General", "")
+        almacenamiento.esperar_escrituras()
+        self.assertFalse(almacenamiento.hay_cambios_externos())
+
+        self.otra_instancia(f'modelo.actualizar_tarea({uno.id}, {{"titulo": "Uno de la otra"}})\n'
+                            f'modelo.eliminar_tarea({dos.id})\n'
+                            'modelo.agregar_tarea("Tres", "", "Estudio", "")')
+        self.assertTrue(almacenamiento.hay_cambios_externos())
+        afectadas = modelo.incorporar_cambios_externos()
+
+        self.assertEqual(len(afectadas), 3)
+        self.assertEqual(tareas_en_memoria(), tareas_guardadas())
+        self.assertEqual(modelo.tareas[uno.id].titulo, "Uno de la otra")
+        self.assertNotIn(dos.id, modelo.tareas)
+        self.assertFalse(almacenamiento.hay_cambios_externos())
+
+    def test_lee_el_snapshot_compactado_por_otra_instancia(self):
+        uno = modelo.agregar_tarea("Uno", "", "General", "")
+        almacenamiento.esperar_escrituras()
+
+        self.otra_instancia("almacenamiento.UMBRAL_COMPACTACION = 2\n"
+                            f'modelo.alternar_completada({uno.id})\n'
+                            'modelo.agregar_tarea("Dos", "", "General", "")')
+        self.assertTrue(os.path.exists(almacenamiento.ARCHIVO_TAREAS))
+        afectadas = modelo.incorporar_cambios_externos()
+
+        self.assertEqual(len(afectadas), 2)
+        self.assertTrue(modelo.tareas[uno.id].completada)
+        self.assertEqual(tareas_en_memoria(), tareas_guardadas())
+
+    def test_aparta_el_snapshot_danado_al_cargar(self):
+        with open(almacenamiento.ARCHIVO_TAREAS, "w") as f:
+            f.write('[{"id": 1, "titulo": "Uno"}, {"id": 2, "tit')
+
+        with self.assertRaises(almacenamiento.ArchivoCorruptoError):
+            modelo.cargar()
+        self.assertFalse(os.path.exists(almacenamiento.ARCHIVO_TAREAS))
+        self.assertEqual(len(glob.glob(almacenamiento.ARCHIVO_TAREAS + ".corrupto-*")), 1)
+        modelo.cargar()
+        self.assertEqual(modelo.tareas, {})
+
+    def test_conserva_las_tareas_en_memoria_si_el_snapshot_se_dana(self):
+        modelo.agregar_tarea("Uno", "", "General", "")
+        almacenamiento.guardar_tareas(modelo.tareas)
+        modelo.agregar_tarea("Dos", "", "General", "")
+        almacenamiento.esperar_escrituras()
+        esperadas = tareas_en_memoria()
+        with open(almacenamiento.ARCHIVO_TAREAS, "w") as f:
+            f.write("[{")
+
+        with self.assertRaises(almacenamiento.ArchivoCorruptoError):
+            modelo.incorporar_cambios_externos()
+        self.assertEqual(tareas_en_memoria(), esperadas)
+        self.assertEqual(tareas_guardadas(), esperadas)
+
+    def test_reintenta_la_escritura_que_fallo(self):
+        escribir = almacenamiento._agregar_al_journal
+        fallas = [OSError("disco lleno")]
+
+        def escribir_con_falla(lineas):
+            if lineas and fallas:
+                raise fallas.pop()
+            escribir(lineas)
+
+        with mock.patch.object(almacenamiento, "_agregar_al_journal", escribir_con_falla):
+            uno = modelo.agregar_tarea("Uno", "", "General", "")
+            with self.assertRaises(OSError):
+                almacenamiento.esperar_escrituras()
+            self.assertIsNotNone(almacenamiento.nuevo_error_escritura())
+            self.assertIsNone(almacenamiento.nuevo_error_escritura())
+
+            dos = modelo.agregar_tarea("Dos", "", "General", "")
+            almacenamiento.esperar_escrituras()
+        self.assertIsNone(almacenamiento.nuevo_error_escritura())
+        self.assertEqual(set(tareas_guardadas()), {uno.id, dos.id})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""Pruebas de los contadores de estadísticas contra un recuento completo."""
+
+import os
+import tempfile
+import unittest
+from datetime import date
+from unittest import mock
+
+from organizador import almacenamiento, estadisticas, modelo
+
+class ContadoresTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio_anterior = os.getcwd()
+        self.directorio = tempfile.TemporaryDirectory()
+        os.chdir(self.directorio.name)
+        self.hoy = date(2026, 1, 10).toordinal()
+        for modulo in ("organizador.modelo", "organizador.estadisticas"):
+            parche = mock.patch(f"{modulo}.dia_actual", lambda: self.hoy)
+            parche.start()
+            self.addCleanup(parche.stop)
+        parche = mock.patch.object(modelo, "DIAS_ARCHIVO", 30)
+        parche.start()
+        self.addCleanup(parche.stop)
+        modelo.cargar()
+
+    def tearDown(self):
+        almacenamiento.esperar_escrituras()
+        os.chdir(self.directorio_anterior)
+        self.directorio.cleanup()
+
+    def test_contadores_coinciden_con_recuento(self):
+        vieja = modelo.agregar_tarea("Vieja", "", "Trabajo", "05/01/2026")
+        manana = modelo.agregar_tarea("Mañana", "", "Personal", "11/01/2026")
+        otra = modelo.agregar_tarea("Otra", "", "General", "")
+        self.assertTrue(estadisticas.verificar_estadisticas(modelo.tareas))
+
+        modelo.alternar_completada(vieja.id)
+        modelo.alternar_importante(manana.id)
+        modelo.actualizar_tarea(otra.id, {'categoria': "Estudio", 'fecha_vencimiento': "01/01/2026"})
+        self.assertTrue(estadisticas.verificar_estadisticas(modelo.tareas))
+
+        # Al día siguiente vence "Mañana"
+        self.hoy += 1
+        self.assertEqual(modelo.actualizar_vencidas(), [manana.id])
+        self.assertTrue(estadisticas.verificar_estadisticas(modelo.tareas))
+
+        # Pasado el plazo, la tarea completada se archiva
+        self.hoy += modelo.DIAS_ARCHIVO
+        modelo.actualizar_vencidas()
+        self.assertEqual(modelo.archivar_completadas(), [vieja.id])
+        self.assertTrue(estadisticas.verificar_estadisticas(modelo.tareas))
+
+        modelo.eliminar_tarea(otra.id)
+        self.assertTrue(estadisticas.verificar_estadisticas(modelo.tareas))
+        self.assertEqual(estadisticas.calcular_estadisticas(modelo.tareas)['total'], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Pruebas de la conversión sin pérdidas entre Tarea y el dict del formato JSON."""
+
+import json
+import unittest
+from datetime import date
+
+from organizador.registro import CAMPOS, Tarea, a_dict, desde_dict
+
+COMPLETA = {"id": 1, "titulo": "Uno", "descripcion": "Detalle", "completada": True,
+            "categoria": "Trabajo", "fecha_vencimiento": "05/01/2026", "importante": False}
+
+class IdaYVueltaTest(unittest.TestCase):
+
+    def assertIdaYVuelta(self, datos):
+        """Comprueba que la tarea vuelve al mismo dict, también pasando por copy() y json.dumps."""
+        tarea = desde_dict(datos)
+        self.assertEqual(a_dict(tarea), datos)
+        self.assertEqual(dict(tarea), datos)
+        self.assertEqual(a_dict(tarea.copy()), datos)
+        self.assertEqual(json.loads(json.dumps(tarea, default=a_dict)), datos)
+        return tarea
+
+    def test_tarea_completa(self):
+        tarea = self.assertIdaYVuelta(COMPLETA)
+        self.assertEqual(list(a_dict(tarea)), list(CAMPOS))
+        self.assertEqual(tarea.dia, date(2026, 1, 5).toordinal())
+
+    def test_campos_faltantes(self):
+        for campo in CAMPOS[1:]:
+            datos = {clave: valor for clave, valor in COMPLETA.items() if clave != campo}
+            with self.subTest(campo=campo):
+                tarea = self.assertIdaYVuelta(datos)
+                self.assertNotIn(campo, tarea)
+                self.assertIsNone(tarea.get(campo))
+        tarea = self.assertIdaYVuelta({"id": 7})
+        self.assertEqual((tarea.titulo, tarea.categoria, tarea.fecha_vencimiento), ("", "General", ""))
+        self.assertFalse(tarea.completada)
+
+    def test_banderas_que_no_son_bool(self):
+        tarea = self.assertIdaYVuelta(dict(COMPLETA, completada=1, importante="si"))
+        self.assertTrue(tarea.completada)
+        self.assertTrue(tarea.importante)
+        tarea = self.assertIdaYVuelta(dict(COMPLETA, completada=0, importante=None))
+        self.assertFalse(tarea.completada)
+        self.assertFalse(tarea.importante)
+
+    def test_categoria_y_fecha_nulas(self):
+        tarea = self.assertIdaYVuelta(dict(COMPLETA, categoria=None, fecha_vencimiento=None))
+        self.assertIsNone(tarea.categoria)
+        self.assertIsNone(tarea.dia)
+
+    def test_fechas_sin_ceros_e_invalidas(self):
+        tarea = self.assertIdaYVuelta(dict(COMPLETA, fecha_vencimiento="1/2/2026"))
+        self.assertEqual(tarea.fecha_vencimiento, "1/2/2026")
+        self.assertEqual(tarea.dia, date(2026, 2, 1).toordinal())
+        tarea = self.assertIdaYVuelta(dict(COMPLETA, fecha_vencimiento="31/02/2026"))
+        self.assertEqual(tarea.fecha_vencimiento, "31/02/2026")
+        self.assertIsNone(tarea.dia)
+        self.assertIdaYVuelta(dict(COMPLETA, fecha_vencimiento="mañana"))
+
+    def test_campos_desconocidos(self):
+        datos = dict(COMPLETA, completada_en="03/01/2026", color="rojo")
+        tarea = self.assertIdaYVuelta(datos)
+        self.assertEqual(list(a_dict(tarea)), list(CAMPOS) + ["completada_en", "color"])
+        self.assertEqual(tarea.get("completada_en"), "03/01/2026")
+
+    def test_copia_independiente(self):
+        tarea = desde_dict(dict(COMPLETA, completada_en="03/01/2026"))
+        copia = tarea.copy()
+        copia.update({"titulo": "Otra", "completada": False, "completada_en": None})
+        self.assertEqual((copia.titulo, copia.completada, copia.get("completada_en")), ("Otra", False, None))
+        self.assertEqual(a_dict(tarea), dict(COMPLETA, completada_en="03/01/2026"))
+
+    def test_cambios_vuelven_a_la_forma_compacta(self):
+        tarea = desde_dict(dict(COMPLETA, completada=1, categoria=None))
+        tarea.update({"completada": False, "categoria": "Estudio"})
+        self.assertEqual(a_dict(tarea), dict(COMPLETA, completada=False, categoria="Estudio"))
+        self.assertEqual(a_dict(Tarea(2, "Dos")), {"id": 2, "titulo": "Dos", "descripcion": "", "completada": False,
+                                                   "categoria": "General", "fecha_vencimiento": "",
+                                                   "importante": False})
+
+if __name__ == "__main__":
+    unittest.main()